@@ -1,7 +1,6 @@
 from flask import Flask, render_template, request, jsonify, send_file, session
 from datetime import datetime
 import os
-import json
 import sys
 # Add this line with other imports
 from external_apis import RxNormAPI
@@ -13,7 +12,7 @@ sys.path.append('.')
 
 from core.cognitive_load import calculate_mcls
 from core.interaction_score import calculate_dir_score_from_list
-from interaction_database import check_interaction
+from interaction_database import iter_interactions
 from elderly_med_burden import (
     assess_beers_criteria,
     calculate_fall_risk,
@@ -28,10 +27,8 @@ from elderly_med_burden import (
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
 
-# Ensure reports folder exists
+# Reports folder, created on first export rather than at import
 REPORTS_DIR = 'reports'
-if not os.path.exists(REPORTS_DIR):
-    os.makedirs(REPORTS_DIR)
 
 # ==================== ROUTES ====================
 
@@ -405,18 +402,12 @@ def internal_server_error(e):
 # ==================== HELPER FUNCTIONS ====================
 
 def filter_interactions_web(meds):
-    """Check interactions - web version"""
-    interactions = []
-    for i, med1 in enumerate(meds):
-        for med2 in meds[i+1:]:
-            interaction = check_interaction(med1["name"], med2["name"])
-            if interaction:
-                interactions.append((
-                    med1["name"],
-                    med2["name"],
-                    interaction["severity"]
-                ))
-    return interactions
+    """Check interactions - web version (pairwise hits from iter_interactions)"""
+    return [
+        (interaction["drugs"][0], interaction["drugs"][1], interaction["severity"])
+        for interaction in iter_interactions([med["name"] for med in meds])
+        if len(interaction["drugs"]) == 2
+    ]
 
 def generate_comprehensive_report_web(patient_info, meds, dir_triggers, mcls_score, mcls_burden, mcls_explanation):
     """Generate report for web"""
@@ -461,6 +452,7 @@ def export_detailed_report_web(report_data, meds, dir_triggers):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     report_filename = f"elderly_med_report_{timestamp}.csv"
     report_path = os.path.join(REPORTS_DIR, report_filename)
+    os.makedirs(REPORTS_DIR, exist_ok=True)
     
     # Your existing CSV generation code here
     import csv
@@ -2,12 +2,50 @@
 # Enhanced Elderly-Focused Canadian Drug Interaction Database
 # Structured for scalability and clinical relevance
 
+import os
 import re
-from typing import Dict, List, Tuple, Optional, Set
-from itertools import combinations, permutations
-from dataclasses import asdict
-from dataclasses import dataclass
-@dataclass
+import struct
+import sys
+from array import array
+from collections import defaultdict
+from typing import ClassVar, Dict, List, Literal, NamedTuple, Tuple, Optional, Set
+from itertools import chain, combinations
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from enum import IntEnum, IntFlag
+
+
+class CYP(IntFlag):
+    """Metabolic enzymes/transporters referenced by DrugProfile, one bit each"""
+    CYP2C9 = 1
+    CYP2C19 = 2
+    CYP2D6 = 4
+    CYP3A4 = 8
+    CYP1A2 = 16
+    CYP2E1 = 32
+    CYP2B6 = 64
+    PGP = 128  # P-glycoprotein
+    MAO = 256
+    COMT = 512
+
+
+_CYP_BY_NAME: Dict[str, CYP] = {**CYP.__members__, "P-glycoprotein": CYP.PGP}
+
+
+def cyp_mask(enzymes) -> int:
+    """OR together the CYP bits for an iterable of enzyme names"""
+    mask = 0
+    for name in enzymes:
+        mask |= _CYP_BY_NAME[name].value
+    return mask
+
+
+# Sort order for severities, most severe first; unknown levels sort last (4)
+_SEVERITY_RANK = {'critical': 0, 'high': 1, 'moderate': 2, 'low': 3}
+
+
+@dataclass(slots=True, frozen=True)
 class DrugInteraction:
     """Data structure for drug interactions"""
     severity: str  # 'critical', 'high', 'moderate', 'low'
@@ -15,57 +53,155 @@ class DrugInteraction:
     mechanism: str  # Pharmacological mechanism
     clinical_evidence: str  # Quality of evidence
     elderly_risk: str  # Specific elderly risk profile
-    alternatives: List[str]  # Safer alternatives
+    alternatives: Tuple[str, ...]  # Safer alternatives
     monitoring: str  # What to monitor
     action: str  # Recommended action
-    references: List[str]  # References (Health Canada, CPS, etc.)
+    references: Tuple[str, ...]  # References (Health Canada, CPS, etc.)
     fall_risk_increase: int  # 0-10 scale
     delirium_risk: bool  # Increases delirium risk?
     renal_risk: bool  # Renal impairment concern?
+    severity_rank: int = field(init=False, repr=False, compare=False)  # _SEVERITY_RANK of severity
+    # Keys, in order, of to_dict()
+    _DICT_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'severity', 'description', 'mechanism', 'clinical_evidence', 'elderly_risk',
+        'alternatives', 'monitoring', 'action', 'references', 'fall_risk_increase',
+        'delirium_risk', 'renal_risk'
+    )
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'severity', sys.intern(self.severity))
+        object.__setattr__(self, 'severity_rank', _SEVERITY_RANK.get(self.severity, 4))
+        # Database literals are written with lists; store them as tuples
+        object.__setattr__(self, 'alternatives', tuple(self.alternatives))
+        object.__setattr__(self, 'references', tuple(self.references))
+    
+    @property
+    def as_dict(self) -> MappingProxyType:
+        """Shared read-only view of to_dict() - use this on hot paths"""
+        return _dict_view(self)
     
     def to_dict(self):
-        return {
-            'severity': self.severity,
-            'description': self.description,
-            'mechanism': self.mechanism,
-            'clinical_evidence': self.clinical_evidence,
-            'elderly_risk': self.elderly_risk,
-            'alternatives': self.alternatives,
-            'monitoring': self.monitoring,
-            'action': self.action,
-            'references': self.references,
-            'fall_risk_increase': self.fall_risk_increase,
-            'delirium_risk': self.delirium_risk,
-            'renal_risk': self.renal_risk
-        }
+        return dict(_dict_view(self))
+
+
+@lru_cache(maxsize=256)
+def _dict_view(record) -> MappingProxyType:
+    """
+    Read-only mapping of record._DICT_FIELDS for a DrugInteraction/DrugProfile.
+    
+    Records are immutable, so each view is built once and shared; it is kept
+    here rather than on the record so that records still pickle, deepcopy and
+    dataclasses.asdict() cleanly.
+    """
+    return MappingProxyType({name: getattr(record, name) for name in record._DICT_FIELDS})
+
+# Generic-name stem -> group of safer alternatives offered for high-ACB drugs;
+# see _ACB_ALTERNATIVES
+_ALTERNATIVES_STEMS = (
+    ("diphenhydramine", "antihistamine_sedating"),
+    ("hydroxyzine", "antihistamine_sedating"),
+    ("oxybutynin", "bladder_antimuscarinic"),
+    ("tolterodine", "bladder_antimuscarinic"),
+    ("solifenacin", "bladder_antimuscarinic"),
+    ("darifenacin", "bladder_antimuscarinic"),
+    ("fesoterodine", "bladder_antimuscarinic"),
+    ("trospium", "bladder_antimuscarinic"),
+    ("amitriptyline", "tricyclic"),
+    ("nortriptyline", "tricyclic"),
+    ("promethazine", "promethazine"),
+    ("scopolamine", "scopolamine"),
+)
+_ALTERNATIVES_BY_STEM = dict(_ALTERNATIVES_STEMS)
+# All stems in one pattern, so a generic is scanned once however long the table grows
+_ALTERNATIVES_STEM_RE = re.compile("|".join(re.escape(stem) for stem, _ in _ALTERNATIVES_STEMS))
+
+
+@lru_cache(maxsize=256)
+def _alternatives_key(generic: str) -> Optional[str]:
+    """
+    Map a generic name (any case) to its _ALTERNATIVES_STEMS group, if any.
+    
+    The leftmost stem in the name wins, e.g. the first component of a
+    combination product.
+    """
+    match = _ALTERNATIVES_STEM_RE.search(generic.lower())
+    return _ALTERNATIVES_BY_STEM[match.group()] if match else None
+
+
+# Generic-name stems for the sedative-burden drug groups
+_Z_DRUGS = ('zolpidem', 'zopiclone', 'eszopiclone')  # non-benzodiazepine hypnotics
+_ATYPICAL_ANTIPSYCHOTICS = ('quetiapine', 'olanzapine', 'risperidone')
+# "Benzodiazepine" in a drug class, but not "Non-benzodiazepine hypnotic"
+_BENZODIAZEPINE_CLASS_RE = re.compile(r"(?<![a-z]-)(?<![a-z])benzodiazepine", re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _sedative_tags(generic_name: str, drug_class: str) -> Tuple[bool, bool, bool, bool]:
+    """(is_z_drug, is_benzodiazepine, is_atypical_antipsychotic, is_mirtazapine)"""
+    generic = generic_name.lower()
+    is_z_drug = any(x in generic for x in _Z_DRUGS)
+    return (
+        is_z_drug,
+        not is_z_drug and _BENZODIAZEPINE_CLASS_RE.search(drug_class) is not None,
+        any(x in generic for x in _ATYPICAL_ANTIPSYCHOTICS),
+        'mirtazapine' in generic,
+    )
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class DrugProfile:
     """Data structure for individual drug profiles"""
     generic_name: str
-    brand_names: List[str]
+    brand_names: Tuple[str, ...]
     drug_class: str
     anticholinergic_score: int  # 0-3 scale
     sedative_score: int  # 0-3 scale
     fall_risk_score: int  # 0-10 scale
     beers_criteria: bool  # Potentially inappropriate for elderly?
     renal_adjustment: bool  # Needs renal dose adjustment?
-    cyp_inhibitors: List[str]  # CYP enzymes inhibited
-    cyp_substrates: List[str]  # CYP enzyme substrates
+    cyp_inhibitors: Tuple[str, ...]  # CYP enzymes inhibited
+    cyp_substrates: Tuple[str, ...]  # CYP enzyme substrates
     pregnancy_category: str
     lactation_safety: str
-    common_elderly_side_effects: List[str]
+    common_elderly_side_effects: Tuple[str, ...]
+    # Bitmask forms of cyp_inhibitors/cyp_substrates over CYP, e.g.
+    # a.cyp_inhibitors_mask & b.cyp_substrates_mask for a metabolic clash
+    cyp_inhibitors_mask: int = field(init=False, repr=False, compare=False)
+    cyp_substrates_mask: int = field(init=False, repr=False, compare=False)
+    alternatives_key: Optional[str] = field(init=False, repr=False, compare=False)
+    # Drug-group tags from _sedative_tags
+    is_z_drug: bool = field(init=False, repr=False, compare=False)
+    is_benzodiazepine: bool = field(init=False, repr=False, compare=False)
+    is_atypical_antipsychotic: bool = field(init=False, repr=False, compare=False)
+    is_mirtazapine: bool = field(init=False, repr=False, compare=False)
+    # Keys, in order, of to_dict()
+    _DICT_FIELDS: ClassVar[Tuple[str, ...]] = (
+        'generic_name', 'drug_class', 'anticholinergic_score', 'sedative_score',
+        'fall_risk_score', 'beers_criteria', 'renal_adjustment'
+    )
+    
+    def __post_init__(self):
+        # Database literals are written with lists; store them as tuples
+        object.__setattr__(self, 'brand_names', tuple(self.brand_names))
+        object.__setattr__(self, 'cyp_inhibitors', tuple(self.cyp_inhibitors))
+        object.__setattr__(self, 'cyp_substrates', tuple(self.cyp_substrates))
+        # Side-effect phrases repeat across profiles; share one object per phrase
+        object.__setattr__(self, 'common_elderly_side_effects',
+                           tuple(sys.intern(effect) for effect in self.common_elderly_side_effects))
+        object.__setattr__(self, 'cyp_inhibitors_mask', cyp_mask(self.cyp_inhibitors))
+        object.__setattr__(self, 'cyp_substrates_mask', cyp_mask(self.cyp_substrates))
+        object.__setattr__(self, 'alternatives_key', _alternatives_key(self.generic_name))
+        for name, value in zip(('is_z_drug', 'is_benzodiazepine', 'is_atypical_antipsychotic', 'is_mirtazapine'),
+                               _sedative_tags(self.generic_name, self.drug_class)):
+            object.__setattr__(self, name, value)
+    
+    @property
+    def as_dict(self) -> MappingProxyType:
+        """Shared read-only view of to_dict() - use this on hot paths"""
+        return _dict_view(self)
     
     def to_dict(self):
-        return {
-            'generic_name': self.generic_name,
-            'drug_class': self.drug_class,
-            'anticholinergic_score': self.anticholinergic_score,
-            'sedative_score': self.sedative_score,
-            'fall_risk_score': self.fall_risk_score,
-            'beers_criteria': self.beers_criteria,
-            'renal_adjustment': self.renal_adjustment
-        }
+        return dict(_dict_view(self))
 
 # ============================================================================
 # DRUG PROFILES DATABASE - Individual Drug Characteristics
@@ -945,6 +1081,233 @@ DRUG_PROFILES: Dict[str, DrugProfile] = {
 }
 #48 + 6 drug profiles
 
+# ============================================================================
+# COLUMNAR PROFILE SCORES
+# ============================================================================
+# The numeric/boolean profile fields laid out as one compact column per field,
+# indexed by DRUG_INDEX. Burden totals over a medication list become a gather
+# over small ints (e.g. sum(ACH_SCORE[i] for i in ids)) instead of walking
+# DrugProfile objects. DRUG_PROFILES remains the row-oriented API.
+
+class Flag(IntFlag):
+    """Per-drug boolean properties, packed into one FLAGS byte per profile"""
+    BEERS = 1
+    RENAL_ADJ = 2
+    QT_PROLONG = 4  # side-effect text mentions QT; not a full QT-risk list
+    SEROTONERGIC = 8
+    BLEED_RISK = 16
+    ANTICH_HIGH = 32
+
+
+# No profile field records serotonergic activity, so it is derived from the
+# drug class (SSRI, SNRI, tricyclic, MAOI) plus the serotonergic opioids
+_SEROTONERGIC_CLASS_RE = re.compile(r"\b(?:ssri|snri|tricyclic|maoi)\b", re.IGNORECASE)
+_SEROTONERGIC_DRUGS = frozenset({"tramadol", "tapentadol", "meperidine", "methadone", "fentanyl"})
+
+
+def _profile_flags(profile: DrugProfile) -> int:
+    effects = [effect.lower() for effect in profile.common_elderly_side_effects]
+    flags = 0
+    if profile.beers_criteria:
+        flags |= Flag.BEERS
+    if profile.renal_adjustment:
+        flags |= Flag.RENAL_ADJ
+    # Only profiles whose side-effect text mentions QT are flagged; drugs with
+    # a QT liability their profile does not list (e.g. quetiapine,
+    # amitriptyline) are not
+    if any('qt' in effect for effect in effects):
+        flags |= Flag.QT_PROLONG
+    if (profile.generic_name in _SEROTONERGIC_DRUGS
+            or _SEROTONERGIC_CLASS_RE.search(profile.drug_class)):
+        flags |= Flag.SEROTONERGIC
+    if any('bleed' in effect for effect in effects):
+        flags |= Flag.BLEED_RISK
+    if profile.anticholinergic_score >= 3:
+        flags |= Flag.ANTICH_HIGH
+    return int(flags)
+
+
+def _build_columns():
+    index: Dict[str, int] = {}
+    ach, sed, fall = array('b'), array('b'), array('b')
+    flags = bytearray()
+    for idx, (name, profile) in enumerate(DRUG_PROFILES.items()):
+        index[name] = idx
+        scores = (profile.anticholinergic_score, profile.sedative_score, profile.fall_risk_score)
+        if not all(-128 <= score <= 127 for score in scores):
+            # array('b') would raise a bare OverflowError; name the culprit
+            # (validate_database_integrity checks the clinical ranges)
+            raise ValueError(f"{name}: scores {scores} do not fit the int8 score columns")
+        ach.append(profile.anticholinergic_score)
+        sed.append(profile.sedative_score)
+        fall.append(profile.fall_risk_score)
+        flags.append(_profile_flags(profile))
+    return MappingProxyType(index), ach, sed, fall, bytes(flags)
+
+
+DRUG_INDEX, ACH_SCORE, SED_SCORE, FALL_SCORE, FLAGS = _build_columns()
+
+# The three scores interleaved per drug with a pad lane:
+# RISK[4*i:4*i + 3] == (ACH_SCORE[i], SED_SCORE[i], FALL_SCORE[i])
+RISK_WIDTH = 4
+RISK = array('b', chain.from_iterable(zip(ACH_SCORE, SED_SCORE, FALL_SCORE, bytes(len(FLAGS)))))
+
+# Row access by the same ids: PROFILES[DRUG_INDEX[name]] is DRUG_PROFILES[name]
+PROFILES: Tuple[DrugProfile, ...] = tuple(DRUG_PROFILES.values())
+
+
+def _flag_mask(flag: Flag) -> int:
+    return sum(1 << idx for idx, bits in enumerate(FLAGS) if bits & flag)
+
+
+# Bit i is set iff PROFILES[i] carries the flag; AND with regimen_mask() and
+# bit_count() to count flagged drugs in a regimen
+BEERS_MASK: int = _flag_mask(Flag.BEERS)
+RENAL_MASK: int = _flag_mask(Flag.RENAL_ADJ)
+
+# Dictionary-encoded categorical fields. CLASS_ID[i] indexes CLASS_VOCAB,
+# PREGNANCY_CODE[i] holds a PregnancyCategory and LACT_ID[i] a Lactation
+# value for PROFILES[i].
+
+class PregnancyCategory(IntEnum):
+    A = 0
+    B = 1
+    C = 2
+    D = 3
+    X = 4
+
+
+class Lactation(IntEnum):
+    """lactation_safety levels; COMPATIBLE..CONTRAINDICATED are ordered by risk"""
+    COMPATIBLE = 0
+    CAUTION = 1
+    AVOID = 2
+    CONTRAINDICATED = 3
+    UNKNOWN = 4
+
+
+CLASS_VOCAB: Tuple[str, ...] = tuple(sorted({profile.drug_class for profile in PROFILES}))
+_CLASS_CODE: Dict[str, int] = {drug_class: code for code, drug_class in enumerate(CLASS_VOCAB)}
+CLASS_ID = array('b', (_CLASS_CODE[profile.drug_class] for profile in PROFILES))
+PREGNANCY_CODE = array('b', (PregnancyCategory[profile.pregnancy_category] for profile in PROFILES))
+LACT_ID = array('b', (Lactation[profile.lactation_safety.upper()] for profile in PROFILES))
+CYP_INH_MASK = array('H', (profile.cyp_inhibitors_mask for profile in PROFILES))
+CYP_SUB_MASK = array('H', (profile.cyp_substrates_mask for profile in PROFILES))
+
+
+def get_class_id(drug_class: str) -> int:
+    """Code of drug_class in CLASS_VOCAB, or -1 if no profile uses it"""
+    return _CLASS_CODE.get(drug_class, -1)
+
+
+def drugs_in_class(drug_class: str) -> List[str]:
+    """
+    Generic names of all profiled drugs with exactly this drug_class.
+    
+    Example:
+        >>> drugs_in_class("NSAID")
+        ['ibuprofen', 'naproxen']
+    """
+    code = get_class_id(drug_class)
+    return [PROFILES[idx].generic_name for idx, cid in enumerate(CLASS_ID) if cid == code]
+
+
+def select_drugs(pregnancy: Optional[Set[str]] = None,
+                 lactation: Optional[Set[Lactation]] = None,
+                 cyp_substrate: int = 0,
+                 cyp_inhibitor: int = 0,
+                 flags: int = 0) -> List[str]:
+    """
+    Filter the drug catalog on the columnar attributes.
+    
+    All given criteria must hold. CYP arguments match drugs touching any of
+    the given enzymes; flags requires every given Flag bit.
+    
+    Args:
+        pregnancy: Allowed pregnancy categories, e.g. {"D", "X"}
+        lactation: Allowed Lactation levels, e.g. {Lactation.AVOID}
+        cyp_substrate: CYP bits the drug must be a substrate of (any)
+        cyp_inhibitor: CYP bits the drug must inhibit (any)
+        flags: Flag bits the drug must carry (all)
+        
+    Returns:
+        Matching generic names in DRUG_INDEX order
+        
+    Example:
+        >>> select_drugs(pregnancy={"X"}, cyp_substrate=CYP.CYP3A4, flags=Flag.BEERS)
+        ['warfarin']
+    """
+    codes = None if pregnancy is None else {PregnancyCategory[cat] for cat in pregnancy}
+    matches = []
+    for idx, profile in enumerate(PROFILES):
+        if codes is not None and PREGNANCY_CODE[idx] not in codes:
+            continue
+        if lactation is not None and LACT_ID[idx] not in lactation:
+            continue
+        if cyp_substrate and not CYP_SUB_MASK[idx] & cyp_substrate:
+            continue
+        if cyp_inhibitor and not CYP_INH_MASK[idx] & cyp_inhibitor:
+            continue
+        if FLAGS[idx] & flags != flags:
+            continue
+        matches.append(profile.generic_name)
+    return matches
+
+
+# Side-effect vocabulary: SIDE_EFFECT_MASKS[i] has bit SIDE_EFFECT_ID[effect]
+# set for each of PROFILES[i].common_elderly_side_effects
+SIDE_EFFECT_VOCAB: Tuple[str, ...] = tuple(sorted({
+    effect for profile in PROFILES for effect in profile.common_elderly_side_effects
+}))
+SIDE_EFFECT_ID: Dict[str, int] = {effect: idx for idx, effect in enumerate(SIDE_EFFECT_VOCAB)}
+SIDE_EFFECT_MASKS: Tuple[int, ...] = tuple(
+    sum(1 << SIDE_EFFECT_ID[effect] for effect in set(profile.common_elderly_side_effects))
+    for profile in PROFILES
+)
+
+
+# ============================================================================
+# PACKED DRUG RECORDS
+# ============================================================================
+# Every coded column above for one drug, stored as a fixed-width struct record
+# in a single contiguous buffer (11 bytes/drug). Unpack one record for
+# row-style access to a drug; use the columns for bulk scans.
+
+class DrugRecord(NamedTuple):
+    class_id: int
+    ach: int
+    sed: int
+    fall: int
+    flags: int
+    cyp_inh: int
+    cyp_sub: int
+    preg: int
+    lact: int
+
+
+_RECORD = struct.Struct("<bbbbBHHbb")
+
+DRUG_RECORDS: bytes = b"".join(
+    _RECORD.pack(CLASS_ID[idx], ACH_SCORE[idx], SED_SCORE[idx], FALL_SCORE[idx], FLAGS[idx],
+                 CYP_INH_MASK[idx], CYP_SUB_MASK[idx], PREGNANCY_CODE[idx], LACT_ID[idx])
+    for idx in range(len(PROFILES))
+)
+
+
+def get_drug_record(drug_name: str) -> Optional[DrugRecord]:
+    """
+    Coded attributes of one drug from DRUG_RECORDS.
+    
+    Example:
+        >>> get_drug_record("Benadryl").ach
+        3
+    """
+    idx = DRUG_INDEX.get(normalize_drug_name(drug_name))
+    if idx is None:
+        return None
+    return DrugRecord._make(_RECORD.unpack_from(DRUG_RECORDS, idx * _RECORD.size))
+
+
 # ============================================================================
 # INTERACTION DATABASE - Structured by Severity and Mechanism
 # ============================================================================
@@ -1113,48 +1476,60 @@ INTERACTION_DATABASE: Dict[frozenset, DrugInteraction] = {
 # THERAPEUTIC DUPLICATION DATABASE
 # ============================================================================
 THERAPEUTIC_CATEGORIES = {
-    "ace_inhibitors": ["lisinopril", "enalapril", "ramipril", "perindopril"],
-    "arb": ["losartan", "valsartan", "candesartan", "irbesartan"],
-    "statin": ["atorvastatin", "simvastatin", "rosuvastatin", "pravastatin"],
-    "ssri": ["sertraline", "escitalopram", "citalopram", "fluoxetine"],
-    "ppi": ["omeprazole", "pantoprazole", "esomeprazole", "lansoprazole"],
-    "nsaid": ["ibuprofen", "naproxen", "diclofenac", "celecoxib"],
-    "benzodiazepine": ["lorazepam", "diazepam", "clonazepam", "alprazolam"],
-    "z_drug": ["zolpidem", "zopiclone", "eszopiclone"],
-    "anticholinergic": ["diphenhydramine", "oxybutynin", "tolterodine", "amitriptyline"]
+    "ace_inhibitors": frozenset({"lisinopril", "enalapril", "ramipril", "perindopril"}),
+    "arb": frozenset({"losartan", "valsartan", "candesartan", "irbesartan"}),
+    "statin": frozenset({"atorvastatin", "simvastatin", "rosuvastatin", "pravastatin"}),
+    "ssri": frozenset({"sertraline", "escitalopram", "citalopram", "fluoxetine"}),
+    "ppi": frozenset({"omeprazole", "pantoprazole", "esomeprazole", "lansoprazole"}),
+    "nsaid": frozenset({"ibuprofen", "naproxen", "diclofenac", "celecoxib"}),
+    "benzodiazepine": frozenset({"lorazepam", "diazepam", "clonazepam", "alprazolam"}),
+    "z_drug": frozenset({"zolpidem", "zopiclone", "eszopiclone"}),
+    "anticholinergic": frozenset({"diphenhydramine", "oxybutynin", "tolterodine", "amitriptyline"})
 }
 
+# Inverse of THERAPEUTIC_CATEGORIES. A drug may sit in several categories, so
+# each maps to a tuple in category order.
+def _invert_categories() -> Dict[str, Tuple[str, ...]]:
+    by_drug: Dict[str, List[str]] = defaultdict(list)
+    for category, drugs in THERAPEUTIC_CATEGORIES.items():
+        for drug in drugs:
+            by_drug[drug].append(category)
+    return {drug: tuple(categories) for drug, categories in by_drug.items()}
+
+
+DRUG_TO_CATEGORIES = _invert_categories()
+
 # ============================================================================
 # FALL RISK CATEGORIZATION
 # ============================================================================
 FALL_RISK_CATEGORIES = {
     "sedative_hypnotics": {
-        "drugs": ["zolpidem", "zopiclone", "eszopiclone", "lorazepam", "diazepam"],
+        "drugs": frozenset({"zolpidem", "zopiclone", "eszopiclone", "lorazepam", "diazepam"}),
         "risk_score": 8,
         "time_of_risk": "Nighttime and morning after dosing"
     },
     "antipsychotics": {
-        "drugs": ["quetiapine", "risperidone", "olanzapine", "haloperidol"],
+        "drugs": frozenset({"quetiapine", "risperidone", "olanzapine", "haloperidol"}),
         "risk_score": 7,
         "time_of_risk": "Within 2 hours of dosing, especially initiation"
     },
     "antidepressants_tca": {
-        "drugs": ["amitriptyline", "nortriptyline", "doxepin"],
+        "drugs": frozenset({"amitriptyline", "nortriptyline", "doxepin"}),
         "risk_score": 6,
         "time_of_risk": "Orthostatic effects: within 1-2 hours of dosing"
     },
     "opioids": {
-        "drugs": ["oxycodone", "hydromorphone", "morphine", "fentanyl"],
+        "drugs": frozenset({"oxycodone", "hydromorphone", "morphine", "fentanyl"}),
         "risk_score": 6,
         "time_of_risk": "Peak concentration: 1-2 hours post-dose"
     },
     "antihypertensives": {
-        "drugs": ["furosemide", "hydrochlorothiazide", "lisinopril", "amlodipine"],
+        "drugs": frozenset({"furosemide", "hydrochlorothiazide", "lisinopril", "amlodipine"}),
         "risk_score": 4,
         "time_of_risk": "Orthostatic: 1-2 hours post-dose, especially first dose"
     },
     "anticholinergics": {
-        "drugs": ["diphenhydramine", "oxybutynin", "tolterodine", "scopolamine"],
+        "drugs": frozenset({"diphenhydramine", "oxybutynin", "tolterodine", "scopolamine"}),
         "risk_score": 5,
         "time_of_risk": "Cognitive effects: cumulative with duration"
     }
@@ -1276,6 +1651,123 @@ DRUG_ALIASES = {
     "asa": "acetylsalicylic acid",
     "acetylsalicylic acid": "acetylsalicylic_acid"
 } 
+
+# ============================================================================
+# STRING INTERNING
+# ============================================================================
+# Canonical drug names recur across interaction keys and alias values, but
+# names built at runtime (e.g. via .lower()) are fresh string objects.
+# Interning both sides lets dict/set probes short-circuit on identity once
+# the hashes match.
+
+DRUG_ALIASES = {sys.intern(alias): sys.intern(generic) for alias, generic in DRUG_ALIASES.items()}
+
+DRUG_PROFILES = {sys.intern(generic): profile for generic, profile in DRUG_PROFILES.items()}
+
+# Inverse of DrugProfile.brand_names (plus each generic name), case-folded.
+# Consulted after DRUG_ALIASES so brands listed only on a profile still resolve.
+BRAND_TO_GENERIC: Dict[str, str] = {
+    sys.intern(name.lower()): generic
+    for generic, profile in DRUG_PROFILES.items()
+    for name in (*profile.brand_names, profile.generic_name)
+}
+
+INTERACTION_DATABASE = {
+    frozenset(sys.intern(drug) for drug in key): interaction
+    for key, interaction in INTERACTION_DATABASE.items()
+}
+_CANON = frozenset(chain.from_iterable(INTERACTION_DATABASE.keys()))
+
+DRUG_INDEX = MappingProxyType({sys.intern(generic): idx for generic, idx in DRUG_INDEX.items()})
+
+THERAPEUTIC_CATEGORIES = {
+    category: frozenset(map(sys.intern, drugs)) for category, drugs in THERAPEUTIC_CATEGORIES.items()
+}
+DRUG_TO_CATEGORIES = _invert_categories()
+for _group in FALL_RISK_CATEGORIES.values():
+    _group["drugs"] = frozenset(map(sys.intern, _group["drugs"]))
+del _group
+
+# Every canonical name normalize_drug_name can hand back from the tables
+_INTERNED_NAMES = _CANON | DRUG_PROFILES.keys() | DRUG_TO_CATEGORIES.keys()
+
+# Lookup index keyed by the sorted tuple of canonical names. INTERACTION_DATABASE
+# stays the public frozenset-keyed table; check_interaction probes this one so
+# a query costs one or two string comparisons instead of a set allocation.
+_INTERACTION_INDEX: Dict[Tuple[str, ...], DrugInteraction] = {
+    tuple(sorted(key)): interaction
+    for key, interaction in INTERACTION_DATABASE.items()
+}
+
+# Multi-drug keys, checked directly against a regimen by check_all_interactions
+_TRIPLE_KEYS: Tuple[Tuple[str, ...], ...] = tuple(key for key in _INTERACTION_INDEX if len(key) == 3)
+
+# Inverted index: canonical drug -> (record, other drugs) for every
+# interaction it takes part in, presorted by severity (stable, so ties keep
+# INTERACTION_DATABASE order). Holding the records directly means queries
+# never hash a frozenset key.
+
+def _build_drug_to_interactions() -> Dict[str, Tuple[Tuple[DrugInteraction, Tuple[str, ...]], ...]]:
+    by_drug: Dict[str, List[Tuple[DrugInteraction, Tuple[str, ...]]]] = defaultdict(list)
+    for key, interaction in INTERACTION_DATABASE.items():
+        members = list(key)
+        for drug in members:
+            by_drug[drug].append((interaction, tuple(d for d in members if d != drug)))
+    return {
+        drug: tuple(sorted(entries, key=lambda entry: entry[0].severity_rank))
+        for drug, entries in by_drug.items()
+    }
+
+
+_DRUG_TO_INTERACTIONS = _build_drug_to_interactions()
+
+# ============================================================================
+# INTEGER ID TABLES
+# ============================================================================
+# Dense integer ids for every canonical name in the interaction table, plus a
+# pair index keyed by a single packed int ((low_id << 16) | high_id). Batch
+# callers resolve names to ids once and then screen pairs with plain integer
+# hashing; see check_interaction_ids.
+
+DRUG_IDS: Dict[str, int] = {name: idx for idx, name in enumerate(sorted(_CANON))}
+
+_PAIR_SHIFT = 16
+
+
+def _pack_pair(id1: int, id2: int) -> int:
+    if id1 > id2:
+        id1, id2 = id2, id1
+    return (id1 << _PAIR_SHIFT) | id2
+
+
+_PAIR_INDEX: Dict[int, DrugInteraction] = {
+    _pack_pair(*(DRUG_IDS[name] for name in key)): interaction
+    for key, interaction in _INTERACTION_INDEX.items()
+    if len(key) == 2
+}
+
+# Dense pairwise severity grid over DRUG_IDS: byte id1 * N + id2 holds the
+# index into SEVERITY_LEVELS (0 = no pairwise interaction). Symmetric.
+SEVERITY_LEVELS: Tuple[Optional[str], ...] = (None, 'low', 'moderate', 'high', 'critical')
+_SEVERITY_CODE: Dict[str, int] = {level: code for code, level in enumerate(SEVERITY_LEVELS) if level}
+
+
+def _build_severity_matrix() -> bytes:
+    n = len(DRUG_IDS)
+    matrix = bytearray(n * n)
+    for packed, interaction in _PAIR_INDEX.items():
+        id1, id2 = packed >> _PAIR_SHIFT, packed & ((1 << _PAIR_SHIFT) - 1)
+        matrix[id1 * n + id2] = matrix[id2 * n + id1] = _SEVERITY_CODE[interaction.severity]
+    return bytes(matrix)
+
+
+INTERACTION_MATRIX = _build_severity_matrix()
+
+# Multi-drug interactions as (member ids, severity code) for cohort screening
+_TRIPLE_IDS: Tuple[Tuple[Tuple[int, ...], int], ...] = tuple(
+    (tuple(DRUG_IDS[name] for name in key), _SEVERITY_CODE[_INTERACTION_INDEX[key].severity])
+    for key in _TRIPLE_KEYS
+)
 # ============================================================================
 
 # ============================================================================
@@ -1293,6 +1785,30 @@ DRUG_ALIASES = {
 # CORE UTILITY FUNCTIONS
 # ============================================================================
 
+# First dose/strength token ("coumadin 5mg", "metformin er 500 mg bid");
+# _normalize_clean strips from here only when the rest of the entry is
+# _DOSE_TAIL_RE words. Only a number followed by a unit counts, so digits
+# that are part of a name ("vitamin b12", "omega-3") are kept.
+_DOSE_SUFFIX_RE = re.compile(r"\s*\d+(?:\.\d+)?\s*(?:mg|mcg|g|ml|units?|%)(?![a-z])")
+# Trailing release-mechanism then dosage-form words, stripped in one scan
+# ("metformin er tablet" -> "metformin"). The endswith() tuple lets names
+# with no such suffix skip the regex entirely.
+_SUFFIX_RE = re.compile(
+    r'(?:\s*(?:sr|er|xr|cr|la|xl))?'
+    r'(?:\s*(?:tablet|tab|capsule|cap|injection|inj|oral|topical))?\s*$'
+)
+# What may follow a dose token or, for the prefix fallback, a known name in
+# _normalize_clean: only doses, units, dosage forms and frequencies
+_DOSE_TAIL_RE = re.compile(
+    r"(?:[\s,/]+(?:\d+(?:\.\d+)?\s*(?:mg|mcg|g|ml|units?|%)?|mg|mcg|g|ml|units?"
+    r"|tablets?|tabs?|capsules?|caps?|pills?|injection|inj|oral|po|topical"
+    r"|sr|er|xr|cr|la|xl|daily|once|twice|a|per|day|bid|tid|qid|qd|qhs|hs|prn|as|needed))*\s*"
+)
+_SUFFIX_WORDS = ('tablet', 'tab', 'capsule', 'cap', 'injection', 'inj', 'oral', 'topical',
+                 'sr', 'er', 'xr', 'cr', 'la', 'xl')
+
+
+@lru_cache(maxsize=2048)
 def normalize_drug_name(drug_name: str) -> str:
     """
     Normalize drug name to standard standard generic form.
@@ -1308,23 +1824,114 @@ def normalize_drug_name(drug_name: str) -> str:
         'acetaminophen'
         >>> normalize_drug_name("Zocor SR")
         'simvastatin'
+        >>> normalize_drug_name("Coumadin 5 mg tablets daily")
+        'warfarin'
+        >>> normalize_drug_name("Tylenol PM")  # combination product: unresolved
+        'tylenol pm'
+        >>> normalize_drug_name("Tylenol with Codeine")
+        'tylenol with codeine'
+        >>> normalize_drug_name("Tylenol 300mg with codeine")
+        'tylenol 300mg with codeine'
     """
     if not drug_name:
         return ""
+    return _normalize_clean(drug_name.lower().strip())
+
+
+def normalize_drug_names(medications: List[str]) -> List[str]:
+    """
+    normalize_drug_name for a whole medication list, in input order.
     
-    drug_name = drug_name.lower().strip()
-    
+    Args:
+        medications: Raw drug names (brand or generic)
+        
+    Returns:
+        Normalized generic names, one per input
+        
+    Example:
+        >>> normalize_drug_names(["Tylenol 500mg", "Zocor SR"])
+        ['acetaminophen', 'simvastatin']
+    """
+    # map() drives the cached C wrapper directly, with no per-item bytecode
+    return list(map(normalize_drug_name, medications))
+
+
+def _normalize_clean(drug_name: str) -> str:
+    """Resolve an already lower-cased, stripped name; see normalize_drug_name."""
     # Check brand names first
     if drug_name in DRUG_ALIASES:
         return DRUG_ALIASES[drug_name]
+    if drug_name in BRAND_TO_GENERIC:
+        return BRAND_TO_GENERIC[drug_name]
+    
+    # Drop a trailing dose annotation, but only when nothing but dose/form/
+    # frequency words follows it; "coumadin 5mg and aspirin 81mg" or
+    # "tylenol 300mg with codeine" may name another drug and stay unresolved
+    dose = _DOSE_SUFFIX_RE.search(drug_name)
+    if dose and _DOSE_TAIL_RE.fullmatch(drug_name, dose.end()):
+        drug_name = drug_name[:dose.start()]
     
     # Remove common suffixes and prefixes
-    drug_name = re.sub(r'\s*(tablet|tab|capsule|cap|injection|inj|oral|topical)\s*$', '', drug_name)
-    drug_name = re.sub(r'\s*(sr|er|xr|cr|la|xl)\s*$', '', drug_name)  # Extended release
+    if drug_name.endswith(_SUFFIX_WORDS):
+        drug_name = _SUFFIX_RE.sub('', drug_name)
     
+    # Brand name may only be recognizable once dose/formulation is stripped
+    if drug_name in DRUG_ALIASES:
+        return DRUG_ALIASES[drug_name]
+    if drug_name in BRAND_TO_GENERIC:
+        return BRAND_TO_GENERIC[drug_name]
+    
+    # Still unknown: accept the longest known name the entry starts with, but
+    # only when the rest is dose/form/frequency words ("coumadin tablets
+    # daily"). Anything else may be another ingredient ("tylenol pm",
+    # "tylenol with codeine"), so the entry stays unresolved.
+    if drug_name not in _INTERNED_NAMES:
+        match = _drug_mention_re().match(drug_name)
+        if match and _DOSE_TAIL_RE.fullmatch(drug_name, match.end()):
+            return _normalize_clean(match.group(1))
+    
+    # Only intern known names so arbitrary user input doesn't pile up in the intern table
+    if drug_name in _INTERNED_NAMES:
+        return sys.intern(drug_name)
     return drug_name
 
 
+@lru_cache(maxsize=None)
+def _drug_mention_re() -> 're.Pattern':
+    """
+    Every known brand/generic/alias spelling as one alternation, longest first
+    so e.g. "acetylsalicylic acid" wins over a shorter overlapping name.
+    
+    Compiled on first use rather than at import: it is a few milliseconds,
+    a large share of import time, and only free-text parsing and the
+    prefix fallback in normalize_drug_name need it.
+    """
+    names = sorted({*DRUG_ALIASES, *BRAND_TO_GENERIC}, key=len, reverse=True)
+    return re.compile(
+        r"(?<![a-z0-9])(" + "|".join(re.escape(name) for name in names) + r")(?![a-z0-9])"
+    )
+
+
+def find_medications_in_text(text: str) -> List[str]:
+    """
+    Extract medications mentioned in free text.
+    
+    Args:
+        text: Free-text note, e.g. "pt takes Lasix 40mg daily, Coumadin 5mg"
+        
+    Returns:
+        Normalized generic names in order of first mention, without repeats
+        
+    Example:
+        >>> find_medications_in_text("Coumadin 5mg, Ambien PRN")
+        ['warfarin', 'zolpidem']
+    """
+    found: Dict[str, None] = {}
+    for match in _drug_mention_re().finditer(text.lower()):
+        found.setdefault(_normalize_clean(match.group(1)))
+    return list(found)
+
+
 def get_drug_profile(drug_name: str) -> Optional['DrugProfile']:
     """
     Retrieve comprehensive drug profile from database.
@@ -1344,6 +1951,112 @@ def get_drug_profile(drug_name: str) -> Optional['DrugProfile']:
     return DRUG_PROFILES.get(normalized)
 
 
+def _get_drug_profile_by_normalized(normalized_name: str) -> Optional['DrugProfile']:
+    """get_drug_profile for a name that has already been through normalize_drug_name."""
+    return DRUG_PROFILES.get(normalized_name)
+
+
+@lru_cache(maxsize=4096)
+def _resolve(drug_name: str) -> Tuple[str, Optional['DrugProfile']]:
+    """
+    Normalize once and return (normalized_name, profile_or_None).
+
+    Cached per raw medication string; both halves of the result are
+    immutable (str, frozen DrugProfile), so sharing them is safe.
+    """
+    normalized = normalize_drug_name(drug_name)
+    return normalized, DRUG_PROFILES.get(normalized) if normalized else None
+
+
+def regimen_mask(medications: List[str]) -> int:
+    """
+    Pack a medication list into a bitmask over DRUG_INDEX.
+    
+    Unknown drugs are ignored and repeats collapse onto the same bit.
+    
+    Args:
+        medications: List of medication names
+        
+    Returns:
+        Integer with bit DRUG_INDEX[generic] set for each profiled drug
+        
+    Example:
+        >>> (regimen_mask(["Benadryl", "warfarin"]) & BEERS_MASK).bit_count()
+        2
+    """
+    mask = 0
+    for med in medications:
+        idx = DRUG_INDEX.get(normalize_drug_name(med))
+        if idx is not None:
+            mask |= 1 << idx
+    return mask
+
+
+def regimen_burden(medications: List[str],
+                   frequencies: Optional[List[float]] = None) -> Tuple[float, float, float]:
+    """
+    Sum anticholinergic, sedative and fall-risk scores over a regimen.
+    
+    Reads each drug's packed RISK row rather than DrugProfile objects.
+    Unknown drugs contribute nothing.
+    
+    Args:
+        medications: List of medication names
+        frequencies: Optional per-medication weights (e.g. doses per day),
+            parallel to medications; defaults to 1 for each
+        
+    Returns:
+        (anticholinergic, sedative, fall_risk) weighted totals
+        
+    Example:
+        >>> regimen_burden(["Benadryl", "Ambien"])
+        (3.0, 6.0, 17.0)
+    """
+    if frequencies is None:
+        frequencies = [1.0] * len(medications)
+    ach = sed = fall = 0.0
+    for med, freq in zip(medications, frequencies):
+        idx = DRUG_INDEX.get(normalize_drug_name(med))
+        if idx is not None:
+            row = idx * RISK_WIDTH
+            ach += RISK[row] * freq
+            sed += RISK[row + 1] * freq
+            fall += RISK[row + 2] * freq
+    return ach, sed, fall
+
+
+def count_beers(mask: int) -> int:
+    """Number of distinct Beers-listed drugs in a regimen_mask()"""
+    return (mask & BEERS_MASK).bit_count()
+
+
+def count_renal(mask: int) -> int:
+    """Number of distinct renally-adjusted drugs in a regimen_mask()"""
+    return (mask & RENAL_MASK).bit_count()
+
+
+def side_effect_mask(medications: List[str]) -> int:
+    """
+    Union of the common elderly side effects across a regimen, as a bitmask.
+    
+    Args:
+        medications: List of medication names
+        
+    Returns:
+        Integer with bit SIDE_EFFECT_ID[effect] set for every side effect
+        
+    Example:
+        >>> bool(side_effect_mask(["Benadryl"]) & (1 << SIDE_EFFECT_ID["Confusion"]))
+        True
+    """
+    mask = 0
+    for med in medications:
+        idx = DRUG_INDEX.get(normalize_drug_name(med))
+        if idx is not None:
+            mask |= SIDE_EFFECT_MASKS[idx]
+    return mask
+
+
 def validate_medication_list(medications: List[str]) -> Tuple[List[str], List[str]]:
     """
     Validate medication list and identify unrecognized drugs.
@@ -1359,15 +2072,9 @@ def validate_medication_list(medications: List[str]) -> Tuple[List[str], List[st
         >>> print(f"Valid: {valid}, Invalid: {invalid}")
         Valid: ['acetaminophen'], Invalid: ['FakeDrug123']
     """
-    valid_drugs = []
-    unrecognized_drugs = []
-    
-    for med in medications:
-        normalized = normalize_drug_name(med)
-        if normalized and get_drug_profile(normalized):
-            valid_drugs.append(med)
-        else:
-            unrecognized_drugs.append(med)
+    resolved = [(med, _resolve(med)[1]) for med in medications]
+    valid_drugs = [med for med, profile in resolved if profile is not None]
+    unrecognized_drugs = [med for med, profile in resolved if profile is None]
     
     return valid_drugs, unrecognized_drugs
 
@@ -1386,18 +2093,112 @@ def check_interaction(drug1: str, drug2: str, drug3: Optional[str] = None) -> Op
         drug3_norm = normalize_drug_name(drug3)
         if not drug3_norm:
             return None
-        key = frozenset({drug1_norm, drug2_norm, drug3_norm})
-        drugs = [drug1, drug2, drug3]
-    else:
-        key = frozenset({drug1_norm, drug2_norm})
-        drugs = [drug1, drug2]
-    if key in INTERACTION_DATABASE:
-        interaction = INTERACTION_DATABASE[key].to_dict()
-        interaction["drugs"] = drugs
-        return interaction
+        return _lookup_normalized((drug1_norm, drug2_norm, drug3_norm), [drug1, drug2, drug3])
+    return _lookup_normalized((drug1_norm, drug2_norm), [drug1, drug2])
+
+
+def get_drug_id(drug_name: str) -> int:
+    """
+    Resolve a raw drug name to its integer id in DRUG_IDS.
+    
+    Args:
+        drug_name: Raw drug name (brand or generic)
+        
+    Returns:
+        Integer id, or -1 if the drug has no known interactions
+    """
+    return DRUG_IDS.get(normalize_drug_name(drug_name), -1)
+
+
+def check_interaction_ids(id1: int, id2: int) -> Optional[DrugInteraction]:
+    """
+    Pairwise interaction lookup over integer ids from get_drug_id.
+    
+    Intended for tight screening loops: no name normalization and no result
+    dict is built. Three-drug interactions are only reachable through
+    check_interaction.
+    
+    Args:
+        id1: First drug id
+        id2: Second drug id
+        
+    Returns:
+        The DrugInteraction record, or None
+    """
+    if id1 < 0 or id2 < 0:
+        return None
+    return _PAIR_INDEX.get(_pack_pair(id1, id2))
+
+
+def interaction_severity_code(id1: int, id2: int) -> int:
+    """
+    Pairwise severity as an index into SEVERITY_LEVELS, read from
+    INTERACTION_MATRIX. Returns 0 for no interaction or unknown ids.
+    """
+    if id1 < 0 or id2 < 0:
+        return 0
+    return INTERACTION_MATRIX[id1 * len(DRUG_IDS) + id2]
+
+
+def _index_key(names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Canonical _INTERACTION_INDEX key for already-normalized names."""
+    if len(names) == 2:
+        a, b = names
+        return (a, b) if a < b else (b, a)
+    # Collapse repeats so e.g. (warfarin, aspirin, aspirin) still finds the pair
+    return tuple(sorted(set(names)))
+
+
+def _lookup_normalized(names: Tuple[str, ...], drugs: List[str]) -> Optional[dict]:
+    """Probe the interaction index with names that are already normalized."""
+    interaction = _INTERACTION_INDEX.get(_index_key(names))
+    if interaction is not None:
+        return {**interaction.as_dict, "drugs": drugs}
     return None
 
 
+def iter_interactions(medications: List[str]):
+    """
+    Lazily yield every interaction in a regimen: pairs first, then triples.
+    
+    Nothing is built until the caller asks for the next hit, so callers that
+    only need to know whether (or how badly) a regimen interacts can stop
+    early; see highest_interaction_severity.
+    
+    Args:
+        medications: List of medication names
+        
+    Yields:
+        Interaction dicts as returned by check_interaction
+    """
+    # Normalize each medication once up front instead of once per combination,
+    # keeping only drugs that appear in some interaction at all (_CANON) -
+    # every combination involving any other drug is a guaranteed miss
+    normalized = [(med, normalize_drug_name(med)) for med in medications]
+    normalized = [pair for pair in normalized if pair[1] in _CANON]
+    # Pairwise
+    for (med1, norm1), (med2, norm2) in combinations(normalized, 2):
+        interaction = _lookup_normalized((norm1, norm2), [med1, med2])
+        if interaction:
+            yield interaction
+    # Triples: only a handful of triple keys exist, so test each against the
+    # regimen instead of enumerating C(N, 3) combinations. Each drug is
+    # represented by its first mention, and hits are reported in the order
+    # the combinations would have produced them.
+    if len(normalized) >= 3:
+        first_index: Dict[str, int] = {}
+        for idx, (_, norm) in enumerate(normalized):
+            first_index.setdefault(norm, idx)
+        hits = []
+        for key in _TRIPLE_KEYS:
+            if all(drug in first_index for drug in key):
+                positions = sorted(first_index[drug] for drug in key)
+                hits.append((positions, _INTERACTION_INDEX[key]))
+        hits.sort(key=lambda hit: hit[0])
+        for positions, interaction in hits:
+            yield {**interaction.as_dict, "drugs": [normalized[idx][0] for idx in positions]}
+
+
 def check_all_interactions(medications: List[str]) -> Dict[str, List[dict]]:
     interactions_by_severity = {
         'critical': [],
@@ -1405,40 +2206,81 @@ def check_all_interactions(medications: List[str]) -> Dict[str, List[dict]]:
         'moderate': [],
         'low': []
     }
-    # Pairwise
-    for combo in combinations(medications, 2):
-        interaction = check_interaction(*combo)
-        if interaction:
-            severity = interaction.get('severity', 'low')
-            if severity in interactions_by_severity:
-                interactions_by_severity[severity].append(interaction)
-    # Triples
-    if len(medications) >= 3:
-        for combo in combinations(medications, 3):
-            interaction = check_interaction(*combo)
-            if interaction:
-                severity = interaction.get('severity', 'low')
-                if severity in interactions_by_severity and interaction not in interactions_by_severity[severity]:
-                    interactions_by_severity[severity].append(interaction)
+    for interaction in iter_interactions(medications):
+        bucket = interactions_by_severity.get(interaction['severity'])
+        if bucket is not None:
+            bucket.append(interaction)
     return interactions_by_severity
 
 
+def highest_interaction_severity(medications: List[str]) -> Optional[str]:
+    """
+    Worst interaction severity in a regimen, or None if there are none.
+    
+    Stops scanning at the first 'critical' hit.
+    
+    Example:
+        >>> highest_interaction_severity(["warfarin", "bactrim", "tylenol"])
+        'critical'
+    """
+    worst = None
+    for interaction in iter_interactions(medications):
+        severity = interaction['severity']
+        if severity == 'critical':
+            return severity
+        if _SEVERITY_RANK.get(severity, 4) < _SEVERITY_RANK.get(worst, 4):
+            worst = severity
+    return worst
+
+
+def screen_cohort(patients: List[List[str]]) -> List[Dict[str, int]]:
+    """
+    Count interactions by severity for many medication lists at once.
+    
+    Each name is resolved to its integer id once, then every pair is read
+    from INTERACTION_MATRIX and each multi-drug interaction is tested against
+    the patient's id set, so no per-hit result dicts are built. Counts match
+    the bucket sizes of check_all_interactions; use that when the interaction
+    details are needed.
+    
+    Args:
+        patients: One medication list per patient
+        
+    Returns:
+        Per-patient severity counts, in input order
+        
+    Example:
+        >>> screen_cohort([["warfarin", "bactrim"], ["tylenol"]])[0]['critical']
+        1
+    """
+    n = len(DRUG_IDS)
+    results = []
+    for medications in patients:
+        tally = [0] * len(SEVERITY_LEVELS)
+        ids = [drug_id for drug_id in map(get_drug_id, medications) if drug_id >= 0]
+        for id1, id2 in combinations(ids, 2):
+            tally[INTERACTION_MATRIX[id1 * n + id2]] += 1
+        present = set(ids)
+        for key_ids, code in _TRIPLE_IDS:
+            if present.issuperset(key_ids):
+                tally[code] += 1
+        results.append({level: tally[_SEVERITY_CODE[level]]
+                        for level in ('critical', 'high', 'moderate', 'low')})
+    return results
+
+
 def get_all_interactions_for_medication(drug_name: str) -> List[dict]:
     normalized = normalize_drug_name(drug_name)
     if not normalized:
         return []
-    interactions = []
-    for key, interaction in INTERACTION_DATABASE.items():
-        drugs_in_inter = list(key)
-        if normalized in drugs_in_inter:
-            other_drugs = [d for d in drugs_in_inter if d != normalized]
-            interaction_data = interaction.to_dict()
-            interaction_data["interacting_drugs"] = other_drugs
-            interaction_data["query_drug"] = drug_name
-            interactions.append(interaction_data)
-    severity_order = {'critical': 0, 'high': 1, 'moderate': 2, 'low': 3}
-    interactions.sort(key=lambda x: severity_order.get(x.get('severity', 'low'), 4))
-    return interactions
+    return [
+        {
+            **interaction.as_dict,
+            "interacting_drugs": list(other_drugs),
+            "query_drug": drug_name
+        }
+        for interaction, other_drugs in _DRUG_TO_INTERACTIONS.get(normalized, ())
+    ]
 
 
 # ============================================================================
@@ -1472,11 +2314,8 @@ def detect_therapeutic_duplicates(medications: List[str]) -> Dict[str, List[str]
             continue
         
         # Check which therapeutic category this drug belongs to
-        for category, drugs in THERAPEUTIC_CATEGORIES.items():
-            if normalized in drugs:
-                if category not in duplicates:
-                    duplicates[category] = []
-                duplicates[category].append(med)
+        for category in DRUG_TO_CATEGORIES.get(normalized, ()):
+            duplicates.setdefault(category, []).append(med)
     
     # Filter for actual duplicates (more than one drug in category)
     return {cat: meds for cat, meds in duplicates.items() if len(meds) > 1}
@@ -1486,6 +2325,15 @@ def detect_therapeutic_duplicates(medications: List[str]) -> Dict[str, List[str]
 # FALL RISK ASSESSMENT
 # ============================================================================
 
+# (min total fall score, risk_category), highest band first
+_FALL_CATEGORY_TABLE = (
+    (15, "CRITICAL"),
+    (10, "HIGH"),
+    (5, "MODERATE"),
+    (float("-inf"), "LOW"),
+)
+
+
 def calculate_fall_risk_score(medications: List[str]) -> dict:
     """
     Calculate comprehensive fall risk score based on medications.
@@ -1518,7 +2366,7 @@ def calculate_fall_risk_score(medications: List[str]) -> dict:
     
     for med in medications:
         normalized = normalize_drug_name(med)
-        profile = get_drug_profile(normalized)
+        profile = _get_drug_profile_by_normalized(normalized)
         
         if profile:
             total_score += profile.fall_risk_score
@@ -1535,14 +2383,9 @@ def calculate_fall_risk_score(medications: List[str]) -> dict:
             unrecognized.append(med)
     
     # Calculate fall risk category
-    if total_score >= 15:
-        risk_category = "CRITICAL"
-    elif total_score >= 10:
-        risk_category = "HIGH"
-    elif total_score >= 5:
-        risk_category = "MODERATE"
-    else:
-        risk_category = "LOW"
+    for threshold, risk_category in _FALL_CATEGORY_TABLE:
+        if total_score >= threshold:
+            break
     
     return {
         "total_score": total_score,
@@ -1556,6 +2399,73 @@ def calculate_fall_risk_score(medications: List[str]) -> dict:
     }
 
 
+def calculate_fall_risk_scores_batch(patients: List[List[str]]) -> List[int]:
+    """
+    total_score from calculate_fall_risk_score for many patients at once.
+    
+    Only the numeric total is computed, straight from the FALL_SCORE column;
+    each distinct medication string is resolved once for the whole cohort
+    and no per-drug detail or recommendations are built.
+    
+    Args:
+        patients: One medication list per patient
+        
+    Returns:
+        Total fall risk score per patient, in input order
+        
+    Example:
+        >>> calculate_fall_risk_scores_batch([["Zolpidem", "Benadryl"], ["Tylenol"]])
+        [17, 0]
+    """
+    index = DRUG_INDEX
+    scores = FALL_SCORE
+    score_of = {}
+    for medications in patients:
+        for med in medications:
+            if med not in score_of:
+                idx = index.get(normalize_drug_name(med))
+                score_of[med] = scores[idx] if idx is not None else 0
+    return [sum(map(score_of.__getitem__, medications)) for medications in patients]
+
+
+# Fixed recommendation blocks for generate_fall_risk_recommendations
+_FALL_URGENT_BLOCK = (
+    "🚨 URGENT: Consider deprescribing high-risk medications",
+    "• Immediate physician consultation recommended",
+    "• Implement 24/7 supervision or facility care evaluation",
+    "• Home safety assessment required within 7 days",
+)
+_FALL_HIGH_BLOCK = (
+    "⚠️ HIGH RISK: Discuss medication changes with physician",
+    "• Schedule medication review within 2 weeks",
+    "• Install grab bars in bathroom and hallways",
+    "• Remove tripping hazards (rugs, cords, clutter)",
+    "• Consider medical alert system",
+)
+_FALL_SEDATIVE_BLOCK = (
+    "\n💊 SEDATIVE MEDICATION CONCERNS:",
+    "• Avoid nighttime ambulation - use bedside commode",
+    "  Reason: Sedatives cause disorientation and impaired balance,",
+    "  especially during nighttime awakenings (peak fall risk period)",
+    "• Ensure adequate lighting for nighttime bathroom trips",
+    "• Wait 8-12 hours after sedative dose before driving",
+)
+_FALL_ANTICHOLINERGIC_BLOCK = (
+    "\n🧠 ANTICHOLINERGIC MEDICATION CONCERNS:",
+    "• Review anticholinergic medications for alternatives",
+    "• Monitor for confusion, dizziness, blurred vision",
+    "• Anticholinergics impair balance, reaction time, and spatial awareness",
+)
+_FALL_ENVIRONMENT_BLOCK = (
+    "\n🛡️ ENVIRONMENTAL SAFETY MEASURES:",
+    "• Keep phone and flashlight within reach at night",
+    "• Wear non-slip footwear indoors",
+    "• Avoid loose-fitting clothing that could cause trips",
+    "• Keep frequently used items within easy reach",
+    "• Consider physical therapy for gait/balance training",
+)
+
+
 def generate_fall_risk_recommendations(score: int, high_risk_meds: List[dict]) -> List[str]:
     """
     Generate personalized fall prevention recommendations.
@@ -1571,55 +2481,32 @@ def generate_fall_risk_recommendations(score: int, high_risk_meds: List[dict]) -
     
     # Critical/High score recommendations
     if score >= 10:
-        recommendations.append("🚨 URGENT: Consider deprescribing high-risk medications")
-        recommendations.append("• Immediate physician consultation recommended")
-        recommendations.append("• Implement 24/7 supervision or facility care evaluation")
-        recommendations.append("• Home safety assessment required within 7 days")
+        recommendations.extend(_FALL_URGENT_BLOCK)
     elif score >= 5:
-        recommendations.append("⚠️ HIGH RISK: Discuss medication changes with physician")
-        recommendations.append("• Schedule medication review within 2 weeks")
-        recommendations.append("• Install grab bars in bathroom and hallways")
-        recommendations.append("• Remove tripping hazards (rugs, cords, clutter)")
-        recommendations.append("• Consider medical alert system")
+        recommendations.extend(_FALL_HIGH_BLOCK)
     
     # Sedative-specific recommendations
     sedative_meds = [m for m in high_risk_meds if m.get("sedative_score", 0) >= 2]
     if sedative_meds:
-        recommendations.append("\n💊 SEDATIVE MEDICATION CONCERNS:")
-        recommendations.append("• Avoid nighttime ambulation - use bedside commode")
-        recommendations.append("  Reason: Sedatives cause disorientation and impaired balance,")
-        recommendations.append("  especially during nighttime awakenings (peak fall risk period)")
-        recommendations.append("• Ensure adequate lighting for nighttime bathroom trips")
-        recommendations.append("• Wait 8-12 hours after sedative dose before driving")
-        for med in sedative_meds:
-            recommendations.append(f"  - {med['name']}: Peak sedation 1-4 hours post-dose")
+        recommendations.extend(_FALL_SEDATIVE_BLOCK)
+        recommendations.extend(f"  - {med['name']}: Peak sedation 1-4 hours post-dose" for med in sedative_meds)
     
     # Anticholinergic-specific recommendations
     anticholinergic_meds = [m for m in high_risk_meds if m.get("anticholinergic_score", 0) >= 2]
     if anticholinergic_meds:
-        recommendations.append("\n🧠 ANTICHOLINERGIC MEDICATION CONCERNS:")
-        recommendations.append("• Review anticholinergic medications for alternatives")
-        recommendations.append("• Monitor for confusion, dizziness, blurred vision")
-        recommendations.append("• Anticholinergics impair balance, reaction time, and spatial awareness")
-        for med in anticholinergic_meds:
-            recommendations.append(f"  - {med['name']}: Consider safer alternatives")
+        recommendations.extend(_FALL_ANTICHOLINERGIC_BLOCK)
+        recommendations.extend(f"  - {med['name']}: Consider safer alternatives" for med in anticholinergic_meds)
     
     # Beers Criteria flags
     beers_meds = [m for m in high_risk_meds if m.get("beers_criteria", False)]
     if beers_meds:
         recommendations.append("\n⚕️ POTENTIALLY INAPPROPRIATE MEDICATIONS (Beers Criteria):")
-        for med in beers_meds:
-            recommendations.append(f"  - {med['name']}: Flagged as high-risk in elderly")
+        recommendations.extend(f"  - {med['name']}: Flagged as high-risk in elderly" for med in beers_meds)
         recommendations.append("• Discuss deprescribing or alternatives with prescriber")
     
     # General safety measures
     if score >= 5:
-        recommendations.append("\n🛡️ ENVIRONMENTAL SAFETY MEASURES:")
-        recommendations.append("• Keep phone and flashlight within reach at night")
-        recommendations.append("• Wear non-slip footwear indoors")
-        recommendations.append("• Avoid loose-fitting clothing that could cause trips")
-        recommendations.append("• Keep frequently used items within easy reach")
-        recommendations.append("• Consider physical therapy for gait/balance training")
+        recommendations.extend(_FALL_ENVIRONMENT_BLOCK)
     
     return recommendations
 
@@ -1628,7 +2515,96 @@ def generate_fall_risk_recommendations(score: int, high_risk_meds: List[dict]) -
 # ANTICHOLINERGIC BURDEN ASSESSMENT
 # ============================================================================
 
-def calculate_anticholinergic_burden(medications: List[str]) -> dict:
+class ContribMed(NamedTuple):
+    """A medication contributing to the ACB total (tuple until the return boundary)."""
+    name: str
+    score: int
+    generic_name: str
+    drug_class: str
+    alternatives_key: Optional[str]  # DrugProfile.alternatives_key
+
+
+# Interpretation buckets for the cumulative ACB score, scanned in order:
+# the first threshold the score reaches wins.
+_ACB_IMPACT_CRITICAL = MappingProxyType({
+    "delirium_risk": "Very high (>60% in hospitalized elderly)",
+    "cognitive_effects": "Severe confusion, disorientation, memory impairment likely",
+    "physical_effects": "Dry mouth, constipation, urinary retention, blurred vision",
+    "fall_risk_contribution": "High - confusion and vision impairment increase falls",
+    "long_term_risk": "Increased dementia risk with chronic exposure (HR 1.54)",
+    "functional_decline": "ADL/IADL impairment likely"
+})
+
+_ACB_IMPACT_HIGH = MappingProxyType({
+    "delirium_risk": "High (40-60% in hospitalized elderly)",
+    "cognitive_effects": "Moderate confusion, memory problems, reduced attention",
+    "physical_effects": "Dry mouth, constipation likely; urinary retention possible",
+    "fall_risk_contribution": "Moderate to high",
+    "long_term_risk": "Chronic use linked to cognitive decline",
+    "functional_decline": "May require assistance with complex tasks"
+})
+
+_ACB_IMPACT_MODERATE = MappingProxyType({
+    "delirium_risk": "Moderate (20-40% in vulnerable elderly)",
+    "cognitive_effects": "Mild confusion possible, especially when ill or hospitalized",
+    "physical_effects": "Dry mouth, mild constipation",
+    "fall_risk_contribution": "Low to moderate",
+    "long_term_risk": "Minimal if short-term use",
+    "functional_decline": "Usually able to function independently"
+})
+
+_ACB_IMPACT_LOW = MappingProxyType({
+    "delirium_risk": "Low (<20%)",
+    "cognitive_effects": "Unlikely in most patients",
+    "physical_effects": "Mild or absent",
+    "fall_risk_contribution": "Minimal",
+    "long_term_risk": "Negligible",
+    "functional_decline": "None expected"
+})
+
+_ACB_IMPACT_NONE = MappingProxyType({
+    "delirium_risk": "No medication-related anticholinergic risk",
+    "cognitive_effects": "None expected",
+    "physical_effects": "None",
+    "fall_risk_contribution": "None",
+    "long_term_risk": "None",
+    "functional_decline": "None"
+})
+
+_ACB_IMPACT_TABLE = (
+    (5, "CRITICAL - Severe delirium and cognitive impairment risk", _ACB_IMPACT_CRITICAL),
+    (3, "HIGH - Significant anticholinergic burden", _ACB_IMPACT_HIGH),
+    (2, "MODERATE - Monitor for anticholinergic effects", _ACB_IMPACT_MODERATE),
+    (1, "LOW - Minimal anticholinergic burden", _ACB_IMPACT_LOW),
+    (0, "NONE", _ACB_IMPACT_NONE),
+)
+
+_ACB_MULTIPLE_HIGH_WARNING = "⚠️ CRITICAL: Multiple high-anticholinergic (score 3) medications - extreme delirium risk"
+_ACB_URGENT_WARNINGS = (
+    "🚨 URGENT: Anticholinergic burden exceeds safe threshold",
+    "• Immediate deprescribing evaluation recommended",
+    "• Risk of anticholinergic toxicity syndrome",
+)
+_ACB_HIGH_WARNINGS = (
+    "⚠️ Avoid additional anticholinergic medications (even OTC like diphenhydramine)",
+    "• Monitor for confusion, urinary retention, constipation, falls",
+    "• Hospitalization increases delirium risk significantly",
+)
+
+# Complete warnings list for each condition mask:
+# bit 0 = two or more score-3 drugs, bit 1 = score >= 3, bit 2 = score >= 5
+_ACB_WARN_TABLE = tuple(
+    ((_ACB_MULTIPLE_HIGH_WARNING,) if mask & 1 else ())
+    + (_ACB_URGENT_WARNINGS if mask & 4 else ())
+    + (_ACB_HIGH_WARNINGS if mask & 2 else ())
+    for mask in range(8)
+)
+
+
+def calculate_anticholinergic_burden(
+    medications: List[str],
+    detail: Literal["score", "summary", "full"] = "full"
+) -> dict:
     """
     Calculate anticholinergic cognitive burden (ACB) score.
     
@@ -1637,6 +2613,10 @@ def calculate_anticholinergic_burden(medications: List[str]) -> dict:
     
     Args:
         medications: List of medication names
+        detail: "full" (default) for the complete assessment; "summary"
+            skips the recommendations (returned as []); "score" returns only
+            total_score, burden_level, contributing_count and
+            high_anticholinergic_count
         
     Returns:
         Dictionary containing:
@@ -1646,7 +2626,7 @@ def calculate_anticholinergic_burden(medications: List[str]) -> dict:
         - contributing_medications: Drugs with ACB >0
         - warnings: Alert messages
         - recommendations: Actionable steps
-        - unrecognized_medications: Drugs not in database
+        - unrecognized_medications: Drugs not in database (each listed once)
         
     Scoring Interpretation:
         - ≥5: CRITICAL - Severe delirium risk
@@ -1661,100 +2641,61 @@ def calculate_anticholinergic_burden(medications: List[str]) -> dict:
         >>> print(result['total_score'])  # Output: 9 (3+3+3)
         >>> print(result['burden_level'])  # Output: 'CRITICAL...'
     """
+    if detail not in ("score", "summary", "full"):
+        raise ValueError(f"detail must be 'score', 'summary' or 'full', not {detail!r}")
+    
     total_score = 0
-    contributing_meds = []
-    unrecognized = []
+    contributing = []
+    high_count = 0
+    unrecognized: Dict[str, None] = {}  # ordered, de-duplicated
     
     for med in medications:
-        normalized = normalize_drug_name(med)
-        profile = get_drug_profile(normalized)
+        profile = _resolve(med)[1]
         
         if profile and profile.anticholinergic_score > 0:
             total_score += profile.anticholinergic_score
-            contributing_meds.append({
-                "name": med,
-                "score": profile.anticholinergic_score,
-                "generic_name": profile.generic_name,
-                "drug_class": profile.drug_class
-            })
+            entry = ContribMed(
+                med, profile.anticholinergic_score, profile.generic_name, profile.drug_class,
+                profile.alternatives_key
+            )
+            contributing.append(entry)
+            if entry.score == 3:
+                high_count += 1
         elif not profile:
-            unrecognized.append(med)
+            unrecognized.setdefault(med, None)
     
     # Interpret cumulative score
-    if total_score >= 5:
-        burden_level = "CRITICAL - Severe delirium and cognitive impairment risk"
-        clinical_impact = {
-            "delirium_risk": "Very high (>60% in hospitalized elderly)",
-            "cognitive_effects": "Severe confusion, disorientation, memory impairment likely",
-            "physical_effects": "Dry mouth, constipation, urinary retention, blurred vision",
-            "fall_risk_contribution": "High - confusion and vision impairment increase falls",
-            "long_term_risk": "Increased dementia risk with chronic exposure (HR 1.54)",
-            "functional_decline": "ADL/IADL impairment likely"
-        }
-    elif total_score >= 3:
-        burden_level = "HIGH - Significant anticholinergic burden"
-        clinical_impact = {
-            "delirium_risk": "High (40-60% in hospitalized elderly)",
-            "cognitive_effects": "Moderate confusion, memory problems, reduced attention",
-            "physical_effects": "Dry mouth, constipation likely; urinary retention possible",
-            "fall_risk_contribution": "Moderate to high",
-            "long_term_risk": "Chronic use linked to cognitive decline",
-            "functional_decline": "May require assistance with complex tasks"
-        }
-    elif total_score >= 2:
-        burden_level = "MODERATE - Monitor for anticholinergic effects"
-        clinical_impact = {
-            "delirium_risk": "Moderate (20-40% in vulnerable elderly)",
-            "cognitive_effects": "Mild confusion possible, especially when ill or hospitalized",
-            "physical_effects": "Dry mouth, mild constipation",
-            "fall_risk_contribution": "Low to moderate",
-            "long_term_risk": "Minimal if short-term use",
-            "functional_decline": "Usually able to function independently"
-        }
-    elif total_score >= 1:
-        burden_level = "LOW - Minimal anticholinergic burden"
-        clinical_impact = {
-            "delirium_risk": "Low (<20%)",
-            "cognitive_effects": "Unlikely in most patients",
-            "physical_effects": "Mild or absent",
-            "fall_risk_contribution": "Minimal",
-            "long_term_risk": "Negligible",
-            "functional_decline": "None expected"
-        }
-    else:
-        burden_level = "NONE"
-        clinical_impact = {
-            "delirium_risk": "No medication-related anticholinergic risk",
-            "cognitive_effects": "None expected",
-            "physical_effects": "None",
-            "fall_risk_contribution": "None",
-            "long_term_risk": "None",
-            "functional_decline": "None"
-        }
+    for threshold, burden_level, impact in _ACB_IMPACT_TABLE:
+        if total_score >= threshold:
+            break
     
-    # Generate warnings
-    warnings = []
-    high_score_meds = [m for m in contributing_meds if m["score"] == 3]
+    if detail == "score":
+        return {
+            "total_score": total_score,
+            "burden_level": burden_level,
+            "contributing_count": len(contributing),
+            "high_anticholinergic_count": high_count
+        }
     
-    if len(high_score_meds) >= 2:
-        warnings.append("⚠️ CRITICAL: Multiple high-anticholinergic (score 3) medications - extreme delirium risk")
+    clinical_impact = dict(impact)
     
-    if total_score >= 5:
-        warnings.append("🚨 URGENT: Anticholinergic burden exceeds safe threshold")
-        warnings.append("• Immediate deprescribing evaluation recommended")
-        warnings.append("• Risk of anticholinergic toxicity syndrome")
+    # Generate warnings
+    mask = (total_score >= 5) << 2 | (total_score >= 3) << 1 | (high_count >= 2)
+    warnings = list(_ACB_WARN_TABLE[mask])
     
-    if total_score >= 3:
-        warnings.append("⚠️ Avoid additional anticholinergic medications (even OTC like diphenhydramine)")
-        warnings.append("• Monitor for confusion, urinary retention, constipation, falls")
-        warnings.append("• Hospitalization increases delirium risk significantly")
+    # Entries leave this function as plain dicts (JSON, templates, callers)
+    contributing_meds = [m._asdict() for m in contributing]
+    high_score_meds = [m for m in contributing_meds if m["score"] == 3]
     
     # Generate recommendations
-    recommendations = generate_anticholinergic_recommendations(
-        total_score, 
-        contributing_meds, 
-        high_score_meds
-    )
+    if detail == "full":
+        recommendations = generate_anticholinergic_recommendations(
+            total_score, 
+            contributing_meds, 
+            high_score_meds
+        )
+    else:
+        recommendations = []
     
     return {
         "total_score": total_score,
@@ -1762,15 +2703,145 @@ def calculate_anticholinergic_burden(medications: List[str]) -> dict:
         "clinical_impact": clinical_impact,
         "contributing_medications": contributing_meds,
         "contributing_count": len(contributing_meds),
-        "high_anticholinergic_count": len(high_score_meds),
+        "high_anticholinergic_count": high_count,
         "warnings": warnings,
         "recommendations": recommendations,
-        "unrecognized_medications": unrecognized,
+        "unrecognized_medications": list(unrecognized),
         "assessment_date": None,  # Placeholder for implementation timestamp
         "evidence_source": "ACB Scale (Campbell et al. 2021)"
     }
 
 
+def calculate_anticholinergic_burden_batch(patients: List[List[str]]) -> List[Tuple[int, int, int]]:
+    """
+    ACB totals for many patients at once, straight from the ACH_SCORE column.
+    
+    Returns the numbers behind calculate_anticholinergic_burden without
+    building the per-drug detail, warnings or recommendations.
+    
+    Args:
+        patients: One medication list per patient
+        
+    Returns:
+        (total_score, contributing_count, high_anticholinergic_count) per
+        patient, in input order
+        
+    Example:
+        >>> calculate_anticholinergic_burden_batch([["Benadryl", "Oxybutynin", "Zoloft"], ["Tylenol"]])
+        [(7, 3, 2), (0, 0, 0)]
+    """
+    index = DRUG_INDEX
+    scores = ACH_SCORE
+    results = []
+    for medications in patients:
+        total = contributing = high = 0
+        for med in medications:
+            idx = index.get(normalize_drug_name(med))
+            if idx is not None:
+                score = scores[idx]
+                if score > 0:
+                    total += score
+                    contributing += 1
+                    if score == 3:
+                        high += 1
+        results.append((total, contributing, high))
+    return results
+
+
+_ACB_RECS_CRITICAL = (
+    "🚨 CRITICAL ACTION REQUIRED:",
+    "• Immediate physician consultation for medication review",
+    "• Consider stopping non-essential anticholinergic medications TODAY",
+    "• Implement delirium precautions if hospitalized",
+    "• Monitor mental status every 4-8 hours",
+    "• Assess for anticholinergic toxicity: agitation, hallucinations, hyperthermia",
+)
+
+_ACB_RECS_HIGH = (
+    "⚠️ HIGH PRIORITY ACTIONS:",
+    "• Schedule URGENT medication review (within 1 week)",
+    "• Deprescribing plan needed - target score <3",
+    "• Monitor for anticholinergic toxicity symptoms",
+    "• Avoid hospitalizations/procedures if possible (↑ delirium risk)",
+)
+
+_ACB_RECS_MODERATE = (
+    "📋 RECOMMENDED ACTIONS:",
+    "• Review medications at next appointment (within 1 month)",
+    "• Avoid adding more anticholinergic drugs",
+    "• Monitor for dry mouth, constipation, confusion",
+    "• Document baseline cognitive function for comparison",
+)
+
+_ACB_ALT_ANTIHISTAMINE = (
+    "  ✓ For allergies: Cetirizine 5-10mg, loratadine 10mg (ACB score 0)",
+    "  ✓ For sleep: Melatonin 3-5mg, trazodone 25-50mg, CBT-I",
+    "  ✗ NOT recommended: Any other antihistamine",
+)
+
+_ACB_ALT_BLADDER = (
+    "  ✓ For overactive bladder: Mirabegron 25-50mg (ACB score 0)",
+    "  ✓ Non-drug: Pelvic floor exercises, timed voiding, bladder training",
+    "  ✓ Consider: Sacral neuromodulation if refractory",
+)
+
+_ACB_ALT_TRICYCLIC = (
+    "  ✓ For depression: Sertraline 25-50mg, citalopram 10-20mg (ACB score 0)",
+    "  ✓ For neuropathic pain: Gabapentin 300-900mg, duloxetine 30-60mg",
+    "  ✓ For migraine prophylaxis: Topiramate, propranolol",
+)
+
+_ACB_ALT_PROMETHAZINE = (
+    "  ✓ For nausea: Ondansetron 4-8mg, metoclopramide 5-10mg",
+    "  ✓ For allergies: Non-sedating antihistamines",
+)
+
+_ACB_ALT_SCOPOLAMINE = (
+    "  ✓ For motion sickness: Meclizine (lower ACB), ginger supplements",
+    "  ✓ Non-drug: Acupressure wristbands, desensitization therapy",
+)
+
+_ACB_RECS_SYMPTOM_MGMT = (
+    "\n🛡️ ANTICHOLINERGIC SYMPTOM MANAGEMENT:",
+    "• Dry mouth:",
+    "  - Sugar-free gum or lozenges (stimulates saliva)",
+    "  - Frequent small sips of water",
+    "  - Saliva substitutes (Biotène products)",
+    "  - Avoid alcohol-based mouthwashes (worsen dryness)",
+    "• Constipation:",
+    "  - Increase fiber: 25-30g daily (fruits, vegetables, whole grains)",
+    "  - Increase fluids: 8-10 glasses water daily",
+    "  - Stool softeners: Docusate 100mg BID",
+    "  - If needed: Senna 8.6mg HS, polyethylene glycol 17g daily",
+    "• Urinary retention:",
+    "  - Monitor urine output (goal >1000mL/day)",
+    "  - Bladder scan if suspected retention (>300mL post-void)",
+    "  - Avoid anticholinergics in men with BPH",
+    "• Blurred vision:",
+    "  - Avoid driving if symptomatic",
+    "  - Optometry review for corrective lenses",
+    "  - Improve home lighting",
+)
+
+_ACB_RECS_MONITORING = (
+    "\n📊 MONITORING RECOMMENDATIONS:",
+    "• Cognitive function: Mini-Cog or MoCA at baseline and every 3-6 months",
+    "• Functional status: ADL/IADL assessment quarterly",
+    "• Constipation: Bowel movement diary (goal: every 1-3 days)",
+    "• Urinary function: Post-void residual if retention suspected",
+    "• Fall assessment: Get-up-and-go test every 6 months",
+)
+
+# DrugProfile.alternatives_key -> alternatives block
+_ACB_ALTERNATIVES = {
+    "antihistamine_sedating": _ACB_ALT_ANTIHISTAMINE,
+    "bladder_antimuscarinic": _ACB_ALT_BLADDER,
+    "tricyclic": _ACB_ALT_TRICYCLIC,
+    "promethazine": _ACB_ALT_PROMETHAZINE,
+    "scopolamine": _ACB_ALT_SCOPOLAMINE,
+}
+
+
 def generate_anticholinergic_recommendations(
     score: int,
     all_meds: List[dict],
@@ -1782,7 +2853,8 @@ def generate_anticholinergic_recommendations(
     Args:
         score: Total anticholinergic score
         all_meds: All contributing medications
-        high_score_meds: Medications with ACB score = 3
+        high_score_meds: Medications with ACB score = 3 (name, drug_class, and
+            alternatives_key or generic_name)
         
     Returns:
         List of prioritized recommendations
@@ -1791,89 +2863,33 @@ def generate_anticholinergic_recommendations(
     
     # Urgent actions based on score
     if score >= 5:
-        recommendations.append("🚨 CRITICAL ACTION REQUIRED:")
-        recommendations.append("• Immediate physician consultation for medication review")
-        recommendations.append("• Consider stopping non-essential anticholinergic medications TODAY")
-        recommendations.append("• Implement delirium precautions if hospitalized")
-        recommendations.append("• Monitor mental status every 4-8 hours")
-        recommendations.append("• Assess for anticholinergic toxicity: agitation, hallucinations, hyperthermia")
-        
+        recommendations.extend(_ACB_RECS_CRITICAL)
     elif score >= 3:
-        recommendations.append("⚠️ HIGH PRIORITY ACTIONS:")
-        recommendations.append("• Schedule URGENT medication review (within 1 week)")
-        recommendations.append("• Deprescribing plan needed - target score <3")
-        recommendations.append("• Monitor for anticholinergic toxicity symptoms")
-        recommendations.append("• Avoid hospitalizations/procedures if possible (↑ delirium risk)")
-        
+        recommendations.extend(_ACB_RECS_HIGH)
     elif score >= 2:
-        recommendations.append("📋 RECOMMENDED ACTIONS:")
-        recommendations.append("• Review medications at next appointment (within 1 month)")
-        recommendations.append("• Avoid adding more anticholinergic drugs")
-        recommendations.append("• Monitor for dry mouth, constipation, confusion")
-        recommendations.append("• Document baseline cognitive function for comparison")
+        recommendations.extend(_ACB_RECS_MODERATE)
     
     # Specific medication recommendations
     if high_score_meds:
         recommendations.append("\n💊 HIGH-RISK MEDICATIONS (Score 3) - STRONGLY CONSIDER ALTERNATIVES:")
         
         for med in high_score_meds:
-            generic = med.get("generic_name", "").lower()
             recommendations.append(f"\n• {med['name']} ({med['drug_class']})")
             
-            # Drug-specific alternatives
-            if "diphenhydramine" in generic or "hydroxyzine" in generic:
-                recommendations.append("  ✓ For allergies: Cetirizine 5-10mg, loratadine 10mg (ACB score 0)")
-                recommendations.append("  ✓ For sleep: Melatonin 3-5mg, trazodone 25-50mg, CBT-I")
-                recommendations.append("  ✗ NOT recommended: Any other antihistamine")
-                
-            elif "oxybutynin" in generic or "tolterodine" in generic:
-                recommendations.append("  ✓ For overactive bladder: Mirabegron 25-50mg (ACB score 0)")
-                recommendations.append("  ✓ Non-drug: Pelvic floor exercises, timed voiding, bladder training")
-                recommendations.append("  ✓ Consider: Sacral neuromodulation if refractory")
-                
-            elif "amitriptyline" in generic or "nortriptyline" in generic:
-                recommendations.append("  ✓ For depression: Sertraline 25-50mg, citalopram 10-20mg (ACB score 0)")
-                recommendations.append("  ✓ For neuropathic pain: Gabapentin 300-900mg, duloxetine 30-60mg")
-                recommendations.append("  ✓ For migraine prophylaxis: Topiramate, propranolol")
-                
-            elif "promethazine" in generic:
-                recommendations.append("  ✓ For nausea: Ondansetron 4-8mg, metoclopramide 5-10mg")
-                recommendations.append("  ✓ For allergies: Non-sedating antihistamines")
-                
-            elif "scopolamine" in generic:
-                recommendations.append("  ✓ For motion sickness: Meclizine (lower ACB), ginger supplements")
-                recommendations.append("  ✓ Non-drug: Acupressure wristbands, desensitization therapy")
+            # Drug-specific alternatives; contributors from
+            # calculate_anticholinergic_burden already carry their profile's key
+            key = med["alternatives_key"] if "alternatives_key" in med else _alternatives_key(med["generic_name"])
+            alternatives = _ACB_ALTERNATIVES.get(key)
+            if alternatives:
+                recommendations.extend(alternatives)
     
     # General anticholinergic symptom management
     if score >= 2:
-        recommendations.append("\n🛡️ ANTICHOLINERGIC SYMPTOM MANAGEMENT:")
-        recommendations.append("• Dry mouth:")
-        recommendations.append("  - Sugar-free gum or lozenges (stimulates saliva)")
-        recommendations.append("  - Frequent small sips of water")
-        recommendations.append("  - Saliva substitutes (Biotène products)")
-        recommendations.append("  - Avoid alcohol-based mouthwashes (worsen dryness)")
-        recommendations.append("• Constipation:")
-        recommendations.append("  - Increase fiber: 25-30g daily (fruits, vegetables, whole grains)")
-        recommendations.append("  - Increase fluids: 8-10 glasses water daily")
-        recommendations.append("  - Stool softeners: Docusate 100mg BID")
-        recommendations.append("  - If needed: Senna 8.6mg HS, polyethylene glycol 17g daily")
-        recommendations.append("• Urinary retention:")
-        recommendations.append("  - Monitor urine output (goal >1000mL/day)")
-        recommendations.append("  - Bladder scan if suspected retention (>300mL post-void)")
-        recommendations.append("  - Avoid anticholinergics in men with BPH")
-        recommendations.append("• Blurred vision:")
-        recommendations.append("  - Avoid driving if symptomatic")
-        recommendations.append("  - Optometry review for corrective lenses")
-        recommendations.append("  - Improve home lighting")
+        recommendations.extend(_ACB_RECS_SYMPTOM_MGMT)
     
     # Monitoring plan
     if score >= 3:
-        recommendations.append("\n📊 MONITORING RECOMMENDATIONS:")
-        recommendations.append("• Cognitive function: Mini-Cog or MoCA at baseline and every 3-6 months")
-        recommendations.append("• Functional status: ADL/IADL assessment quarterly")
-        recommendations.append("• Constipation: Bowel movement diary (goal: every 1-3 days)")
-        recommendations.append("• Urinary function: Post-void residual if retention suspected")
-        recommendations.append("• Fall assessment: Get-up-and-go test every 6 months")
+        recommendations.extend(_ACB_RECS_MONITORING)
     
     return recommendations
 
@@ -1882,7 +2898,111 @@ def generate_anticholinergic_recommendations(
 # SEDATIVE BURDEN ASSESSMENT
 # ============================================================================
 
-def calculate_sedative_burden(medications: List[str]) -> dict:
+# Sedative warning rules, checked in order; each predicate receives
+# (total_score, high_count, moderate_count, benzodiazepine_plus_z_drug)
+_SED_WARNING_RULES = (
+    (lambda total, high, moderate, combo: high >= 2, (
+        "⚠️ CRITICAL: Multiple high-sedative (score 3) medications - extreme fall and respiratory risk",
+        "• Risk of synergistic CNS depression",
+        "• Consider hospitalization for monitoring if acutely changed",
+    )),
+    (lambda total, high, moderate, combo: high >= 1 and moderate >= 1, (
+        "⚠️ HIGH RISK: High-sedative drug + moderate sedative - synergistic CNS depression",
+        "• Combined effect greater than sum of individual effects",
+    )),
+    (lambda total, high, moderate, combo: total >= 5, (
+        "🚨 URGENT: Sedative burden exceeds safe threshold for elderly",
+        "• Immediate medication review and deprescribing evaluation required",
+        "• High risk of respiratory failure in setting of infection/illness",
+    )),
+    (lambda total, high, moderate, combo: high >= 1 or moderate >= 1, (
+        "⏰ TIMING ALERT: Nighttime ambulation highest risk period",
+        "• Peak sedation: 1-4 hours post-dose",
+        "• Confusion and disorientation common during nighttime awakenings",
+        "• Implement bathroom safety measures immediately",
+    )),
+    (lambda total, high, moderate, combo: combo, (
+        "🚨 DANGEROUS COMBINATION: Benzodiazepine + Z-drug detected",
+        "• No therapeutic benefit to combining these",
+        "• Synergistic respiratory depression and fall risk",
+    )),
+)
+
+
+class SedativeContrib(NamedTuple):
+    """A medication contributing to the sedative total (tuple until the return boundary)."""
+    name: str
+    score: int
+    generic_name: str
+    drug_class: str
+    fall_risk_score: int
+    # DrugProfile drug-group tags, in _sedative_tags order
+    is_z_drug: bool
+    is_benzodiazepine: bool
+    is_atypical_antipsychotic: bool
+    is_mirtazapine: bool
+
+
+# Sedative burden bands, scanned in order: the first threshold the score
+# reaches wins (clinical_impact is copied per call by calculate_sedative_burden)
+_SED_IMPACT_CRITICAL = MappingProxyType({
+    "fall_risk": "Extremely high (>50% 12-month fall risk)",
+    "cognitive_effects": "Severe sedation, confusion, slowed reflexes",
+    "respiratory_risk": "Significant respiratory depression risk, especially with opioids",
+    "next_day_effects": "Prolonged sedation expected (12-24+ hours)",
+    "driving_safety": "Absolutely unsafe to drive (impairment equivalent to BAC >0.08%)",
+    "functional_impact": "ADL impairment likely - assistance needed for basic activities"
+})
+
+_SED_IMPACT_HIGH = MappingProxyType({
+    "fall_risk": "Very high (30-50% 12-month fall risk)",
+    "cognitive_effects": "Moderate to severe sedation, impaired judgment",
+    "respiratory_risk": "Monitor for respiratory depression (RR <12/min)",
+    "next_day_effects": "Morning sedation likely (8-12 hours residual)",
+    "driving_safety": "Driving not recommended (impairment equivalent to BAC 0.05-0.08%)",
+    "functional_impact": "May need assistance with IADLs"
+})
+
+_SED_IMPACT_MODERATE = MappingProxyType({
+    "fall_risk": "Elevated (20-30% 12-month fall risk)",
+    "cognitive_effects": "Mild to moderate drowsiness, reduced alertness",
+    "respiratory_risk": "Low risk in most patients (monitor in COPD/OSA)",
+    "next_day_effects": "Possible morning grogginess (4-8 hours residual)",
+    "driving_safety": "Use caution, assess individual response after 2 weeks",
+    "functional_impact": "Usually able to function with monitoring"
+})
+
+_SED_IMPACT_LOW = MappingProxyType({
+    "fall_risk": "Slightly elevated (10-20% 12-month fall risk)",
+    "cognitive_effects": "Mild drowsiness possible in sensitive individuals",
+    "respiratory_risk": "Negligible",
+    "next_day_effects": "Usually resolves overnight",
+    "driving_safety": "Generally safe after 2-week adjustment period",
+    "functional_impact": "Minimal impairment"
+})
+
+_SED_IMPACT_NONE = MappingProxyType({
+    "fall_risk": "No medication-related sedation risk",
+    "cognitive_effects": "No sedative effects expected",
+    "respiratory_risk": "None",
+    "next_day_effects": "None",
+    "driving_safety": "No restrictions",
+    "functional_impact": "None"
+})
+
+_SED_IMPACT_TABLE = (
+    (5, "CRITICAL - Severe CNS depression and fall risk", _SED_IMPACT_CRITICAL),
+    (3, "HIGH - Significant sedation and fall risk", _SED_IMPACT_HIGH),
+    (2, "MODERATE - Monitor for excessive sedation", _SED_IMPACT_MODERATE),
+    (1, "LOW - Minimal sedation expected", _SED_IMPACT_LOW),
+    (0, "NONE", _SED_IMPACT_NONE),
+)
+
+
+def calculate_sedative_burden(
+    medications: List[str],
+    detail: Literal["score", "summary", "full"] = "full"
+) -> dict:
     """
     Calculate sedative burden score.
     
@@ -1891,6 +3011,9 @@ def calculate_sedative_burden(medications: List[str]) -> dict:
     
     Args:
         medications: List of medication names
+        detail: "full" (default) for the complete assessment; "summary"
+            skips the recommendations (returned as [] and ""); "score"
+            returns only total_score, burden_level and the three counts
         
     Returns:
         Dictionary containing:
@@ -1900,6 +3023,7 @@ def calculate_sedative_burden(medications: List[str]) -> dict:
         - contributing_medications: Drugs with sedative score >0
         - warnings: Alert messages
         - recommendations: Actionable steps
+        - recommendations_text: recommendations joined with newlines
         - unrecognized_medications: Drugs not in database
         
     Scoring Interpretation:
@@ -1915,136 +3039,332 @@ def calculate_sedative_burden(medications: List[str]) -> dict:
         >>> print(result['total_score'])  # Output: 9 (3+3+3)
         >>> print(result['burden_level'])  # Output: 'CRITICAL...'
     """
+    if detail not in ("score", "summary", "full"):
+        raise ValueError(f"detail must be 'score', 'summary' or 'full', not {detail!r}")
+    
+    # Cached per exact medication list (order and repeats matter); every
+    # mutable part of the result is copied so callers never share state
+    cached = _sedative_burden_cached(tuple(medications), detail)
+    result = dict(cached)
+    if detail == "score":
+        return result
+    result["clinical_impact"] = dict(cached["clinical_impact"])
+    result["contributing_medications"] = [dict(m) for m in cached["contributing_medications"]]
+    for key in ("warnings", "recommendations", "unrecognized_medications"):
+        result[key] = list(cached[key])
+    return result
+
+
+@lru_cache(maxsize=256)
+def _sedative_burden_cached(medications: Tuple[str, ...], detail: str) -> dict:
+    """calculate_sedative_burden body; the returned dict must not be handed out as-is."""
     total_score = 0
     contributing_meds = []
+    high_sedative_meds = []
+    moderate_sedative_meds = []
+    benzodiazepines = []
+    z_drugs = []
     unrecognized = []
     
     for med in medications:
-        normalized = normalize_drug_name(med)
-        profile = get_drug_profile(normalized)
+        profile = _resolve(med)[1]
         
         if profile and profile.sedative_score > 0:
             total_score += profile.sedative_score
-            contributing_meds.append({
-                "name": med,
-                "score": profile.sedative_score,
-                "generic_name": profile.generic_name,
-                "drug_class": profile.drug_class,
-                "fall_risk_score": profile.fall_risk_score
-            })
+            entry = SedativeContrib(
+                med, profile.sedative_score, profile.generic_name, profile.drug_class,
+                profile.fall_risk_score, profile.is_z_drug, profile.is_benzodiazepine,
+                profile.is_atypical_antipsychotic, profile.is_mirtazapine
+            )
+            contributing_meds.append(entry)
+            if profile.sedative_score == 3:
+                high_sedative_meds.append(entry)
+            elif profile.sedative_score == 2:
+                moderate_sedative_meds.append(entry)
+            if profile.is_benzodiazepine:
+                benzodiazepines.append(entry)
+            if profile.is_z_drug:
+                z_drugs.append(entry)
         elif not profile:
             unrecognized.append(med)
     
     # Interpret cumulative score
-    if total_score >= 5:
-        burden_level = "CRITICAL - Severe CNS depression and fall risk"
-        clinical_impact = {
-            "fall_risk": "Extremely high (>50% 12-month fall risk)",
-            "cognitive_effects": "Severe sedation, confusion, slowed reflexes",
-            "respiratory_risk": "Significant respiratory depression risk, especially with opioids",
-            "next_day_effects": "Prolonged sedation expected (12-24+ hours)",
-            "driving_safety": "Absolutely unsafe to drive (impairment equivalent to BAC >0.08%)",
-            "functional_impact": "ADL impairment likely - assistance needed for basic activities"
-        }
-    elif total_score >= 3:
-        burden_level = "HIGH - Significant sedation and fall risk"
-        clinical_impact = {
-            "fall_risk": "Very high (30-50% 12-month fall risk)",
-            "cognitive_effects": "Moderate to severe sedation, impaired judgment",
-            "respiratory_risk": "Monitor for respiratory depression (RR <12/min)",
-            "next_day_effects": "Morning sedation likely (8-12 hours residual)",
-            "driving_safety": "Driving not recommended (impairment equivalent to BAC 0.05-0.08%)",
-            "functional_impact": "May need assistance with IADLs"
-        }
-    elif total_score >= 2:
-        burden_level = "MODERATE - Monitor for excessive sedation"
-        clinical_impact = {
-            "fall_risk": "Elevated (20-30% 12-month fall risk)",
-            "cognitive_effects": "Mild to moderate drowsiness, reduced alertness",
-            "respiratory_risk": "Low risk in most patients (monitor in COPD/OSA)",
-            "next_day_effects": "Possible morning grogginess (4-8 hours residual)",
-            "driving_safety": "Use caution, assess individual response after 2 weeks",
-            "functional_impact": "Usually able to function with monitoring"
-        }
-    elif total_score >= 1:
-        burden_level = "LOW - Minimal sedation expected"
-        clinical_impact = {
-            "fall_risk": "Slightly elevated (10-20% 12-month fall risk)",
-            "cognitive_effects": "Mild drowsiness possible in sensitive individuals",
-            "respiratory_risk": "Negligible",
-            "next_day_effects": "Usually resolves overnight",
-            "driving_safety": "Generally safe after 2-week adjustment period",
-            "functional_impact": "Minimal impairment"
-        }
-    else:
-        burden_level = "NONE"
-        clinical_impact = {
-            "fall_risk": "No medication-related sedation risk",
-            "cognitive_effects": "No sedative effects expected",
-            "respiratory_risk": "None",
-            "next_day_effects": "None",
-            "driving_safety": "No restrictions",
-            "functional_impact": "None"
+    for threshold, burden_level, clinical_impact in _SED_IMPACT_TABLE:
+        if total_score >= threshold:
+            break
+    
+    if detail == "score":
+        return {
+            "total_score": total_score,
+            "burden_level": burden_level,
+            "contributing_count": len(contributing_meds),
+            "high_sedative_count": len(high_sedative_meds),
+            "moderate_sedative_count": len(moderate_sedative_meds)
         }
     
     # Generate warnings
     warnings = []
-    high_sedative_meds = [m for m in contributing_meds if m["score"] == 3]
-    moderate_sedative_meds = [m for m in contributing_meds if m["score"] == 2]
-    
-    if len(high_sedative_meds) >= 2:
-        warnings.append("⚠️ CRITICAL: Multiple high-sedative (score 3) medications - extreme fall and respiratory risk")
-        warnings.append("• Risk of synergistic CNS depression")
-        warnings.append("• Consider hospitalization for monitoring if acutely changed")
-    
-    if len(high_sedative_meds) >= 1 and len(moderate_sedative_meds) >= 1:
-        warnings.append("⚠️ HIGH RISK: High-sedative drug + moderate sedative - synergistic CNS depression")
-        warnings.append("• Combined effect greater than sum of individual effects")
-    
-    if total_score >= 5:
-        warnings.append("🚨 URGENT: Sedative burden exceeds safe threshold for elderly")
-        warnings.append("• Immediate medication review and deprescribing evaluation required")
-        warnings.append("• High risk of respiratory failure in setting of infection/illness")
-    
-    if any(m["score"] >= 2 for m in contributing_meds):
-        warnings.append("⏰ TIMING ALERT: Nighttime ambulation highest risk period")
-        warnings.append("• Peak sedation: 1-4 hours post-dose")
-        warnings.append("• Confusion and disorientation common during nighttime awakenings")
-        warnings.append("• Implement bathroom safety measures immediately")
-    
-    # Check for specific high-risk combinations
-    benzodiazepines = [m for m in contributing_meds if 'benzodiazepine' in m.get('drug_class', '').lower()]
-    z_drugs = [m for m in contributing_meds if any(x in m.get('generic_name', '').lower() 
-                                                    for x in ['zolpidem', 'zopiclone', 'eszopiclone'])]
-    if benzodiazepines and z_drugs:
-        warnings.append("🚨 DANGEROUS COMBINATION: Benzodiazepine + Z-drug detected")
-        warnings.append("• No therapeutic benefit to combining these")
-        warnings.append("• Synergistic respiratory depression and fall risk")
-    
-    # Generate recommendations
-    recommendations = generate_sedative_burden_recommendations(
-        total_score,
-        contributing_meds,
-        high_sedative_meds,
-        moderate_sedative_meds
-    )
+    facts = (total_score, len(high_sedative_meds), len(moderate_sedative_meds),
+             bool(benzodiazepines and z_drugs))
+    for applies, messages in _SED_WARNING_RULES:
+        if applies(*facts):
+            warnings.extend(messages)
+    
+    # Entries leave this function as plain dicts, built once per cached list
+    contributing_dicts = [m._asdict() for m in contributing_meds]
+    
+    # Generate recommendations; a zero score has none to give, so skip the
+    # call outright
+    if detail == "full" and total_score:
+        recommendations = generate_sedative_burden_recommendations(
+            total_score,
+            contributing_dicts,
+            [m for m in contributing_dicts if m["score"] == 3],
+            [m for m in contributing_dicts if m["score"] == 2]
+        )
+    else:
+        recommendations = []
     
     return {
         "total_score": total_score,
         "burden_level": burden_level,
         "clinical_impact": clinical_impact,
-        "contributing_medications": contributing_meds,
+        "contributing_medications": contributing_dicts,
         "contributing_count": len(contributing_meds),
         "high_sedative_count": len(high_sedative_meds),
         "moderate_sedative_count": len(moderate_sedative_meds),
         "warnings": warnings,
         "recommendations": recommendations,
+        "recommendations_text": "\n".join(recommendations),
         "unrecognized_medications": unrecognized,
         "assessment_date": None,
         "evidence_source": "Woolcott et al. Meta-analysis (2009)"
     }
 
 
+def calculate_sedative_burden_batch(patients: List[List[str]]) -> List[Tuple[int, int, int, int]]:
+    """
+    Sedative totals for many patients at once, straight from the SED_SCORE column.
+    
+    Each distinct medication string is resolved once for the whole cohort;
+    no per-drug detail, warnings or recommendations are built.
+    
+    Args:
+        patients: One medication list per patient
+        
+    Returns:
+        (total_score, contributing_count, high_sedative_count,
+        moderate_sedative_count) per patient, in input order
+        
+    Example:
+        >>> calculate_sedative_burden_batch([["Ambien", "Seroquel", "Zoloft"], ["Tylenol"]])
+        [(7, 3, 1, 2), (0, 0, 0, 0)]
+    """
+    index = DRUG_INDEX
+    scores = SED_SCORE
+    score_of = {}
+    for medications in patients:
+        for med in medications:
+            if med not in score_of:
+                idx = index.get(normalize_drug_name(med))
+                score_of[med] = scores[idx] if idx is not None else 0
+    results = []
+    for medications in patients:
+        total = contributing = high = moderate = 0
+        for med in medications:
+            score = score_of[med]
+            if score > 0:
+                total += score
+                contributing += 1
+                if score == 3:
+                    high += 1
+                elif score == 2:
+                    moderate += 1
+        results.append((total, contributing, high, moderate))
+    return results
+
+
+# Fixed recommendation blocks for generate_sedative_burden_recommendations
+_SED_RECS_CRITICAL = (
+    "🚨 CRITICAL ACTION REQUIRED:",
+    "• Immediate physician consultation for medication review (TODAY)",
+    "• Consider hospitalization or increased monitoring if acutely altered mental status",
+    "• Implement fall precautions:",
+    "  - Bed alarm system",
+    "  - 1:1 supervision if available",
+    "  - Bedside commode (avoid ambulation)",
+    "• Hold non-essential sedating medications until reviewed by MD",
+    "• Monitor vital signs:",
+    "  - Respiratory rate every 4 hours (target >12/min)",
+    "  - Oxygen saturation (target >92% on room air)",
+    "  - Level of consciousness (AVPU scale)",
+)
+
+_SED_RECS_HIGH = (
+    "⚠️ HIGH PRIORITY ACTIONS:",
+    "• Schedule URGENT medication review within 24-48 hours",
+    "• Deprescribing plan needed - target total score <3",
+    "• Implement enhanced fall precautions at home:",
+    "  - Remove all scatter rugs and floor clutter",
+    "  - Install night lights in bedroom, bathroom, hallway",
+    "  - Use bedside commode at night",
+    "• STRICTLY AVOID alcohol - synergistic effect can be fatal",
+    "• Educate family/caregivers on fall risk",
+)
+
+_SED_RECS_MODERATE = (
+    "📋 RECOMMENDED ACTIONS:",
+    "• Medication review at next appointment (within 1-2 weeks)",
+    "• Monitor for excessive sedation, falls, confusion",
+    "• Consider non-pharmacological alternatives where possible",
+    "• Document baseline functional status for comparison",
+)
+
+_SED_SAFETY_BLOCK = (
+    "\n🛡️ ENVIRONMENTAL SAFETY MEASURES:",
+    "Physical modifications:",
+    "• Bedside commode mandatory for nighttime use (avoid walking to bathroom)",
+    "• Motion-activated night lights: Bedroom, bathroom, hallway",
+    "• Remove all tripping hazards:",
+    "  - Scatter rugs and bath mats",
+    "  - Electrical cords across walkways",
+    "  - Low furniture, ottomans, pet toys",
+    "• Install grab bars: Beside toilet, in shower/tub, along hallways",
+    "• Keep essentials within reach: Phone, flashlight, water, glasses",
+    "\nPersonal safety:",
+    "• Non-slip footwear indoors (avoid socks, slippers without backs)",
+    "• Properly fitted clothing (avoid long robes, loose pants)",
+    "• Medical alert system/pendant (especially if living alone)",
+    "• Emergency contacts posted visibly",
+    "\nProhibitions:",
+    "• ❌ STRICTLY AVOID alcohol (synergistic sedation, can be fatal)",
+    "• ❌ NO driving within 8-12 hours of sedative medication",
+    "• ❌ NO operating machinery or climbing ladders",
+    "• ❌ Avoid over-the-counter sleep aids (compounding effect)",
+)
+
+_SED_MONITORING_BLOCK = (
+    "\n📊 MONITORING PARAMETERS:",
+    "Daily monitoring (caregiver or self):",
+    "• Mental status: Alert vs. drowsy vs. confused vs. obtunded",
+    "• Respiratory rate: Count breaths for 60 seconds",
+    "  - Normal: 12-20/min",
+    "  - Concerning: <12/min → call MD",
+    "  - Emergency: <8/min → call 911",
+    "• Oxygen saturation (if pulse oximeter available):",
+    "  - Target: >92% on room air",
+    "  - If <88%: Seek immediate medical attention",
+    "• Balance and gait before ambulation:",
+    "  - Sit on edge of bed 30 seconds before standing",
+    "  - Stand with support, wait for dizziness to clear",
+    "  - Use walker/cane if available",
+    "\nWeekly monitoring:",
+    "• Fall diary: Document all falls AND near-misses",
+    "• Functional status: ADLs (bathing, dressing, eating, toileting)",
+    "• Sleep quality: Total hours, nighttime awakenings, daytime naps",
+    "\nMonthly monitoring (healthcare provider):",
+    "• Cognitive function: Mini-Cog, MoCA, or clock draw",
+    "• Get-up-and-go test (fall risk assessment)",
+    "• Medication review: Reassess need for each sedative",
+)
+
+_SED_TIMING_BLOCK = (
+    "\n⏰ MEDICATION TIMING OPTIMIZATION:",
+    "Dosing schedule:",
+    "• Take all sedating medications at bedtime only (unless directed otherwise)",
+    "• Avoid daytime doses if possible (request long-acting formulations)",
+    "• Separate sedatives by 1-2 hours if multiple needed (reduce peak overlap)",
+    "\nActivity restrictions:",
+    "• No driving for at least 8-12 hours after sedative dose",
+    "  - Longer for long-acting drugs (diazepam: 24 hours)",
+    "• Schedule demanding activities (appointments, errands) in morning",
+    "• Avoid afternoon naps >30 minutes (worsens nighttime sedation)",
+    "\nOptimization strategies:",
+    "• 'Drug holidays': Consider skipping doses 1-2 nights/week (with MD approval)",
+    "• Scheduled awakening: Set alarm before typical wake time (reduce grogginess)",
+    "• Morning light exposure: 30 minutes sunlight/bright light to promote alertness",
+)
+
+_SED_CAREGIVER_BLOCK = (
+    "\n👥 CAREGIVER EDUCATION:",
+    "Train caregivers to recognize:",
+    "• Excessive sedation: Difficult to arouse, slurred speech, unsteady gait",
+    "• Respiratory depression: Slow/shallow breathing, blue lips/fingernails",
+    "• Paradoxical agitation: Confusion, combativeness (especially benzodiazepines)",
+    "• Fall warning signs: Dizziness, weakness, grabbing for support",
+    "\nCaregiver actions:",
+    "• Peak risk period: 1-4 hours after medication dose",
+    "• During peak: Stay within earshot, check every 30-60 minutes",
+    "• If patient must walk: Provide physical support, use gait belt",
+    "• If excessive sedation: Hold next dose, contact MD",
+    "• If respiratory rate <10: Call 911 immediately",
+)
+
+
+_SED_ALT_Z_DRUG = (
+    "  ⚠️ Beers Criteria: AVOID in elderly",
+    "  ✓ Non-drug FIRST (most effective):",
+    "    - Cognitive Behavioral Therapy for Insomnia (CBT-I)",
+    "    - Sleep hygiene: Regular schedule, dark room, cool temperature",
+    "    - Stimulus control: Use bed only for sleep",
+    "  ✓ Pharmacological alternatives (if behavioral fails):",
+    "    - Melatonin 3-5mg 1 hour before bed (low risk)",
+    "    - Trazodone 25-50mg HS (sedative score 1-2)",
+    "  ✗ Do NOT substitute with:",
+    "    - Benzodiazepines (equally risky)",
+    "    - Diphenhydramine (high anticholinergic)",
+)
+
+_SED_ALT_BENZODIAZEPINE = (
+    "  ⚠️ Beers Criteria: AVOID in elderly",
+    "  🚨 CRITICAL: Do NOT stop abruptly (seizure risk)",
+    "  ✓ Tapering protocol (coordinate with prescriber):",
+    "    - Reduce by 10-25% every 1-2 weeks",
+    "    - Monitor for withdrawal: Anxiety, tremor, insomnia, seizures",
+    "    - Consider switching to long-acting (e.g., lorazepam → diazepam) for taper",
+    "  ✓ For anxiety (underlying indication):",
+    "    - SSRI/SNRI: Sertraline 25mg, escitalopram 5mg (titrate slowly)",
+    "    - Buspirone 5mg TID (non-sedating, no dependence)",
+    "    - CBT, mindfulness-based stress reduction",
+    "  ✓ For sleep:",
+    "    - See CBT-I recommendations above",
+)
+
+_SED_ALT_ATYPICAL_ANTIPSYCHOTIC = (
+    "  ⚠️ BLACK BOX WARNING: Increased mortality in dementia patients",
+    "  ❓ Review indication:",
+    "    - If for sleep only: DISCONTINUE (not approved, high risk)",
+    "    - If for psychosis/bipolar: Consider lower-risk alternatives",
+    "  ✓ For behavioral symptoms of dementia:",
+    "    - Non-drug first: Environment modification, routine, music therapy",
+    "    - If needed: Citalopram 10-20mg, trazodone 25-50mg",
+    "  ✓ For psychosis:",
+    "    - Consider lower doses",
+    "    - Aripiprazole (less sedating)",
+    "    - Regular monitoring: Weight, glucose, lipids, movement disorders",
+)
+
+_SED_ALT_MIRTAZAPINE = (
+    "  📊 Dose-sedation relationship: INVERSE (lower doses more sedating)",
+    "    - 7.5mg HS: Very sedating (antihistamine effect)",
+    "    - 15-30mg: Moderate sedation",
+    "    - 45mg: Less sedating (noradrenergic effects dominate)",
+    "  ✓ If for depression:",
+    "    - Consider less-sedating SSRI: Sertraline, citalopram, escitalopram",
+    "  ✓ If for appetite stimulation:",
+    "    - Low-dose acceptable if benefits outweigh fall risk",
+    "    - Monitor weight, sedation, falls closely",
+)
+
+# First matching _sedative_tags group -> alternatives block, in tag order
+_HIGH_SED_BLOCKS = (
+    _SED_ALT_Z_DRUG,
+    _SED_ALT_BENZODIAZEPINE,
+    _SED_ALT_ATYPICAL_ANTIPSYCHOTIC,
+    _SED_ALT_MIRTAZAPINE,
+)
+
+
 def generate_sedative_burden_recommendations(
     score: int,
     all_meds: List[dict],
@@ -2067,180 +3387,48 @@ def generate_sedative_burden_recommendations(
     
     # Urgent actions based on score
     if score >= 5:
-        recommendations.append("🚨 CRITICAL ACTION REQUIRED:")
-        recommendations.append("• Immediate physician consultation for medication review (TODAY)")
-        recommendations.append("• Consider hospitalization or increased monitoring if acutely altered mental status")
-        recommendations.append("• Implement fall precautions:")
-        recommendations.append("  - Bed alarm system")
-        recommendations.append("  - 1:1 supervision if available")
-        recommendations.append("  - Bedside commode (avoid ambulation)")
-        recommendations.append("• Hold non-essential sedating medications until reviewed by MD")
-        recommendations.append("• Monitor vital signs:")
-        recommendations.append("  - Respiratory rate every 4 hours (target >12/min)")
-        recommendations.append("  - Oxygen saturation (target >92% on room air)")
-        recommendations.append("  - Level of consciousness (AVPU scale)")
-        
+        recommendations.extend(_SED_RECS_CRITICAL)
     elif score >= 3:
-        recommendations.append("⚠️ HIGH PRIORITY ACTIONS:")
-        recommendations.append("• Schedule URGENT medication review within 24-48 hours")
-        recommendations.append("• Deprescribing plan needed - target total score <3")
-        recommendations.append("• Implement enhanced fall precautions at home:")
-        recommendations.append("  - Remove all scatter rugs and floor clutter")
-        recommendations.append("  - Install night lights in bedroom, bathroom, hallway")
-        recommendations.append("  - Use bedside commode at night")
-        recommendations.append("• STRICTLY AVOID alcohol - synergistic effect can be fatal")
-        recommendations.append("• Educate family/caregivers on fall risk")
-        
+        recommendations.extend(_SED_RECS_HIGH)
     elif score >= 2:
-        recommendations.append("📋 RECOMMENDED ACTIONS:")
-        recommendations.append("• Medication review at next appointment (within 1-2 weeks)")
-        recommendations.append("• Monitor for excessive sedation, falls, confusion")
-        recommendations.append("• Consider non-pharmacological alternatives where possible")
-        recommendations.append("• Document baseline functional status for comparison")
+        recommendations.extend(_SED_RECS_MODERATE)
     
     # Specific medication-class recommendations
     if high_sedative:
         recommendations.append("\n💊 HIGH-SEDATIVE MEDICATIONS (Score 3) - STRONGLY CONSIDER ALTERNATIVES:")
         
         for med in high_sedative:
-            generic = med.get("generic_name", "").lower()
-            drug_class = med.get("drug_class", "").lower()
+            # Contributors from calculate_sedative_burden already carry their
+            # profile's tags; other callers' dicts are tagged from the names
+            if "is_z_drug" in med:
+                tags = (med["is_z_drug"], med["is_benzodiazepine"],
+                        med["is_atypical_antipsychotic"], med["is_mirtazapine"])
+            else:
+                tags = _sedative_tags(med["generic_name"], med["drug_class"])
             recommendations.append(f"\n• {med['name']} ({med['drug_class']})")
             
-            # Z-drugs (non-benzodiazepine hypnotics)
-            if any(x in generic for x in ['zolpidem', 'zopiclone', 'eszopiclone']):
-                recommendations.append("  ⚠️ Beers Criteria: AVOID in elderly")
-                recommendations.append("  ✓ Non-drug FIRST (most effective):")
-                recommendations.append("    - Cognitive Behavioral Therapy for Insomnia (CBT-I)")
-                recommendations.append("    - Sleep hygiene: Regular schedule, dark room, cool temperature")
-                recommendations.append("    - Stimulus control: Use bed only for sleep")
-                recommendations.append("  ✓ Pharmacological alternatives (if behavioral fails):")
-                recommendations.append("    - Melatonin 3-5mg 1 hour before bed (low risk)")
-                recommendations.append("    - Trazodone 25-50mg HS (sedative score 1-2)")
-                recommendations.append("  ✗ Do NOT substitute with:")
-                recommendations.append("    - Benzodiazepines (equally risky)")
-                recommendations.append("    - Diphenhydramine (high anticholinergic)")
-                
-            # Benzodiazepines
-            elif 'benzodiazepine' in drug_class:
-                recommendations.append("  ⚠️ Beers Criteria: AVOID in elderly")
-                recommendations.append("  🚨 CRITICAL: Do NOT stop abruptly (seizure risk)")
-                recommendations.append("  ✓ Tapering protocol (coordinate with prescriber):")
-                recommendations.append("    - Reduce by 10-25% every 1-2 weeks")
-                recommendations.append("    - Monitor for withdrawal: Anxiety, tremor, insomnia, seizures")
-                recommendations.append("    - Consider switching to long-acting (e.g., lorazepam → diazepam) for taper")
-                recommendations.append("  ✓ For anxiety (underlying indication):")
-                recommendations.append("    - SSRI/SNRI: Sertraline 25mg, escitalopram 5mg (titrate slowly)")
-                recommendations.append("    - Buspirone 5mg TID (non-sedating, no dependence)")
-                recommendations.append("    - CBT, mindfulness-based stress reduction")
-                recommendations.append("  ✓ For sleep:")
-                recommendations.append("    - See CBT-I recommendations above")
-                
-            # Atypical antipsychotics (often used off-label)
-            elif any(x in generic for x in ['quetiapine', 'olanzapine', 'risperidone']):
-                recommendations.append("  ⚠️ BLACK BOX WARNING: Increased mortality in dementia patients")
-                recommendations.append("  ❓ Review indication:")
-                recommendations.append("    - If for sleep only: DISCONTINUE (not approved, high risk)")
-                recommendations.append("    - If for psychosis/bipolar: Consider lower-risk alternatives")
-                recommendations.append("  ✓ For behavioral symptoms of dementia:")
-                recommendations.append("    - Non-drug first: Environment modification, routine, music therapy")
-                recommendations.append("    - If needed: Citalopram 10-20mg, trazodone 25-50mg")
-                recommendations.append("  ✓ For psychosis:")
-                recommendations.append("    - Consider lower doses")
-                recommendations.append("    - Aripiprazole (less sedating)")
-                recommendations.append("    - Regular monitoring: Weight, glucose, lipids, movement disorders")
-                
-            # Sedating antidepressants
-            elif 'mirtazapine' in generic:
-                recommendations.append("  📊 Dose-sedation relationship: INVERSE (lower doses more sedating)")
-                recommendations.append("    - 7.5mg HS: Very sedating (antihistamine effect)")
-                recommendations.append("    - 15-30mg: Moderate sedation")
-                recommendations.append("    - 45mg: Less sedating (noradrenergic effects dominate)")
-                recommendations.append("  ✓ If for depression:")
-                recommendations.append("    - Consider less-sedating SSRI: Sertraline, citalopram, escitalopram")
-                recommendations.append("  ✓ If for appetite stimulation:")
-                recommendations.append("    - Low-dose acceptable if benefits outweigh fall risk")
-                recommendations.append("    - Monitor weight, sedation, falls closely")
+            # Drug-specific alternatives: Z-drug, benzodiazepine, atypical
+            # antipsychotic or sedating antidepressant, first tag wins
+            for tagged, block in zip(tags, _HIGH_SED_BLOCKS):
+                if tagged:
+                    recommendations.extend(block)
+                    break
     
     # Safety measures (all score levels ≥2)
     if score >= 2:
-        recommendations.append("\n🛡️ ENVIRONMENTAL SAFETY MEASURES:")
-        recommendations.append("Physical modifications:")
-        recommendations.append("• Bedside commode mandatory for nighttime use (avoid walking to bathroom)")
-        recommendations.append("• Motion-activated night lights: Bedroom, bathroom, hallway")
-        recommendations.append("• Remove all tripping hazards:")
-        recommendations.append("  - Scatter rugs and bath mats")
-        recommendations.append("  - Electrical cords across walkways")
-        recommendations.append("  - Low furniture, ottomans, pet toys")
-        recommendations.append("• Install grab bars: Beside toilet, in shower/tub, along hallways")
-        recommendations.append("• Keep essentials within reach: Phone, flashlight, water, glasses")
-        recommendations.append("\nPersonal safety:")
-        recommendations.append("• Non-slip footwear indoors (avoid socks, slippers without backs)")
-        recommendations.append("• Properly fitted clothing (avoid long robes, loose pants)")
-        recommendations.append("• Medical alert system/pendant (especially if living alone)")
-        recommendations.append("• Emergency contacts posted visibly")
-        recommendations.append("\nProhibitions:")
-        recommendations.append("• ❌ STRICTLY AVOID alcohol (synergistic sedation, can be fatal)")
-        recommendations.append("• ❌ NO driving within 8-12 hours of sedative medication")
-        recommendations.append("• ❌ NO operating machinery or climbing ladders")
-        recommendations.append("• ❌ Avoid over-the-counter sleep aids (compounding effect)")
+        recommendations.extend(_SED_SAFETY_BLOCK)
     
     # Monitoring recommendations (score ≥3)
     if score >= 3:
-        recommendations.append("\n📊 MONITORING PARAMETERS:")
-        recommendations.append("Daily monitoring (caregiver or self):")
-        recommendations.append("• Mental status: Alert vs. drowsy vs. confused vs. obtunded")
-        recommendations.append("• Respiratory rate: Count breaths for 60 seconds")
-        recommendations.append("  - Normal: 12-20/min")
-        recommendations.append("  - Concerning: <12/min → call MD")
-        recommendations.append("  - Emergency: <8/min → call 911")
-        recommendations.append("• Oxygen saturation (if pulse oximeter available):")
-        recommendations.append("  - Target: >92% on room air")
-        recommendations.append("  - If <88%: Seek immediate medical attention")
-        recommendations.append("• Balance and gait before ambulation:")
-        recommendations.append("  - Sit on edge of bed 30 seconds before standing")
-        recommendations.append("  - Stand with support, wait for dizziness to clear")
-        recommendations.append("  - Use walker/cane if available")
-        recommendations.append("\nWeekly monitoring:")
-        recommendations.append("• Fall diary: Document all falls AND near-misses")
-        recommendations.append("• Functional status: ADLs (bathing, dressing, eating, toileting)")
-        recommendations.append("• Sleep quality: Total hours, nighttime awakenings, daytime naps")
-        recommendations.append("\nMonthly monitoring (healthcare provider):")
-        recommendations.append("• Cognitive function: Mini-Cog, MoCA, or clock draw")
-        recommendations.append("• Get-up-and-go test (fall risk assessment)")
-        recommendations.append("• Medication review: Reassess need for each sedative")
+        recommendations.extend(_SED_MONITORING_BLOCK)
     
     # Medication timing optimization (score ≥2)
     if score >= 2:
-        recommendations.append("\n⏰ MEDICATION TIMING OPTIMIZATION:")
-        recommendations.append("Dosing schedule:")
-        recommendations.append("• Take all sedating medications at bedtime only (unless directed otherwise)")
-        recommendations.append("• Avoid daytime doses if possible (request long-acting formulations)")
-        recommendations.append("• Separate sedatives by 1-2 hours if multiple needed (reduce peak overlap)")
-        recommendations.append("\nActivity restrictions:")
-        recommendations.append("• No driving for at least 8-12 hours after sedative dose")
-        recommendations.append("  - Longer for long-acting drugs (diazepam: 24 hours)")
-        recommendations.append("• Schedule demanding activities (appointments, errands) in morning")
-        recommendations.append("• Avoid afternoon naps >30 minutes (worsens nighttime sedation)")
-        recommendations.append("\nOptimization strategies:")
-        recommendations.append("• 'Drug holidays': Consider skipping doses 1-2 nights/week (with MD approval)")
-        recommendations.append("• Scheduled awakening: Set alarm before typical wake time (reduce grogginess)")
-        recommendations.append("• Morning light exposure: 30 minutes sunlight/bright light to promote alertness")
+        recommendations.extend(_SED_TIMING_BLOCK)
     
     # Caregiver education (score ≥3)
     if score >= 3:
-        recommendations.append("\n👥 CAREGIVER EDUCATION:")
-        recommendations.append("Train caregivers to recognize:")
-        recommendations.append("• Excessive sedation: Difficult to arouse, slurred speech, unsteady gait")
-        recommendations.append("• Respiratory depression: Slow/shallow breathing, blue lips/fingernails")
-        recommendations.append("• Paradoxical agitation: Confusion, combativeness (especially benzodiazepines)")
-        recommendations.append("• Fall warning signs: Dizziness, weakness, grabbing for support")
-        recommendations.append("\nCaregiver actions:")
-        recommendations.append("• Peak risk period: 1-4 hours after medication dose")
-        recommendations.append("• During peak: Stay within earshot, check every 30-60 minutes")
-        recommendations.append("• If patient must walk: Provide physical support, use gait belt")
-        recommendations.append("• If excessive sedation: Hold next dose, contact MD")
-        recommendations.append("• If respiratory rate <10: Call 911 immediately")
+        recommendations.extend(_SED_CAREGIVER_BLOCK)
     
     return recommendations
 
@@ -2249,7 +3437,106 @@ def generate_sedative_burden_recommendations(
 # COMBINED CNS BURDEN ASSESSMENT
 # ============================================================================
 
-def calculate_combined_cns_burden(medications: List[str]) -> dict:
+# (min total CNS score, combined_risk_level, synergistic_multiplier,
+# risk_interpretation), highest band first. The multiplier represents how
+# much worse the effects are than simple addition.
+_CNS_LEVEL_TABLE = (
+    (8, "CRITICAL - Synergistic CNS depression", 1.5,  # 50% worse than additive
+     "Extreme delirium risk (>80% in hospitalized elderly). Immediate intervention required."),
+    (5, "HIGH - Multiple CNS depressant mechanisms", 1.3,  # 30% worse
+     "High delirium risk (60-80% in vulnerable populations). Urgent deprescribing needed."),
+    (3, "MODERATE - Monitor cumulative CNS effects", 1.2,  # 20% worse
+     "Moderate delirium risk (40-60% in hospitalized). Monitor closely, consider alternatives."),
+    (1, "LOW - Minimal combined burden", 1.0,  # Minimal synergy at low scores
+     "Low risk (<40%). Appropriate monitoring sufficient."),
+    (0, "NONE", 1.0,
+     "No CNS burden detected. No medication-related cognitive risk."),
+)
+
+# Static text of the synergy warnings; the count, multiplier and effective
+# burden lines are formatted per call around these
+_SYNERGY_WARN_STATIC = (
+    "• Combined effect: Anticholinergic + Sedative effects MULTIPLY each other",
+    "• This is NOT simple addition - the interaction is exponential",
+    "",
+    "🧠 CLINICAL SIGNIFICANCE:",
+    "• Delirium risk increases EXPONENTIALLY (not linearly) with combined burden",
+    "• Hospitalized elderly with high combined burden: 80-90% delirium rate",
+    "• Functional decline accelerates: 50% lose independence within 6 months",
+    "• Mortality risk: 2-3x higher in first year",
+    "",
+)
+
+_SYNERGY_WARN_FOOTER = "• This represents the ACTUAL clinical impact (worse than raw score suggests)"
+
+_SYNERGY_CRITICAL_ALERT = (
+    "\n🚨 CRITICAL ALERT:",
+    "• Combined CNS burden at DANGEROUS level",
+    "• Immediate action required to prevent serious adverse outcomes",
+    "• Consider emergency department evaluation if acutely confused",
+)
+
+# Static sections of the tiered deprescribing strategy (total CNS score >= 5)
+_DEPRESCRIBE_TIER_HEADER = (
+    "🎯 DEPRESCRIBING STRATEGY - PRIORITY ORDER:",
+    "",
+    "TIER 1 (HIGHEST PRIORITY - Remove FIRST):",
+    "Dual-mechanism drugs (anticholinergic + sedative):",
+)
+
+_DEPRESCRIBE_TIER1_NOTES = (
+    "  → These drugs cause BOTH confusion AND sedation",
+    "  → Removing ONE dual-mechanism drug reduces BOTH burdens",
+    "  → Maximum benefit with single deprescribing intervention",
+)
+
+_DEPRESCRIBE_TIER2_HEADER = (
+    "",
+    "TIER 2 (HIGH PRIORITY):",
+    "Single-mechanism drugs with highest scores (ACB=3 or Sedative=3):",
+)
+
+_DEPRESCRIBE_TIER3_4 = (
+    "",
+    "TIER 3 (MODERATE PRIORITY):",
+    "Non-essential medications (sleep aids, as-needed anxiolytics, OTC products)",
+    "  → Often these were started for convenience, not medical necessity",
+    "  → Easiest to discontinue without replacement",
+    "",
+    "TIER 4 (IF TARGET NOT REACHED):",
+    "Moderate-score drugs (ACB=2 or Sedative=2)",
+    "  → Consider alternatives or dose reduction",
+    "  → May need gradual taper",
+    "",
+    "═══════════════════════════════════════════════",
+    "🎯 TARGET GOALS FOR SAFE CNS BURDEN:",
+    "═══════════════════════════════════════════════",
+    "Current status → Target goals:",
+)
+
+_DEPRESCRIBE_TIMELINE_CAVEATS = (
+    "",
+    "📅 TIMELINE:",
+    "• Tier 1 (dual-mechanism): Remove within 1 week",
+    "• Tier 2 (high-score): Remove within 2-4 weeks",
+    "• Tier 3 (non-essential): Remove within 4-8 weeks",
+    "• Tier 4 (moderate-score): Remove within 8-12 weeks",
+    "",
+    "⚠️ IMPORTANT CAVEATS:",
+    "• Benzodiazepines: MUST taper slowly (seizure risk if abrupt stop)",
+    "• Antipsychotics: Gradual taper over weeks to prevent withdrawal psychosis",
+    "• Antidepressants: Taper over 4-6 weeks to prevent discontinuation syndrome",
+    "• Always coordinate with prescribing physician before stopping medications",
+)
+
+
+def calculate_combined_cns_burden(
+    medications: List[str],
+    detail: Literal["summary", "full"] = "full",
+    *,
+    anticholinergic_result: Optional[dict] = None,
+    sedative_result: Optional[dict] = None
+) -> dict:
     """
     Calculate COMBINED anticholinergic + sedative burden.
     
@@ -2258,6 +3545,14 @@ def calculate_combined_cns_burden(medications: List[str]) -> dict:
     
     Args:
         medications: List of medication names
+        detail: "full" (default) for the complete assessment; "summary"
+            skips the warning and deprescribing text (synergistic_warnings
+            and combined_recommendations returned as []) and runs the
+            individual burdens at "summary" detail
+        anticholinergic_result: Full calculate_anticholinergic_burden result
+            for the same list, if the caller already has it
+        sedative_result: Full calculate_sedative_burden result for the same
+            list, if the caller already has it
         
     Returns:
         Dictionary containing:
@@ -2284,163 +3579,108 @@ def calculate_combined_cns_burden(medications: List[str]) -> dict:
         >>> print(result['dual_mechanism_count'])  # 2 (diphenhydramine, amitriptyline)
         >>> print(result['synergistic_multiplier'])  # 1.5x
     """
-    # Calculate individual burdens
-    anticholinergic_result = calculate_anticholinergic_burden(medications)
-    sedative_result = calculate_sedative_burden(medications)
+    if detail not in ("summary", "full"):
+        raise ValueError(f"detail must be 'summary' or 'full', not {detail!r}")
+    
+    # Calculate individual burdens (unless the caller already did)
+    if anticholinergic_result is None:
+        anticholinergic_result = calculate_anticholinergic_burden(medications, detail)
+    if sedative_result is None:
+        sedative_result = calculate_sedative_burden(medications, detail)
     
     # Identify medications contributing to BOTH burdens (dual mechanism)
     # These are HIGHEST PRIORITY for deprescribing
-    dual_burden_meds = []
+    dual_hits = []
     for med in medications:
-        normalized = normalize_drug_name(med)
-        profile = get_drug_profile(normalized)
+        profile = _resolve(med)[1]
         
         if profile and profile.anticholinergic_score > 0 and profile.sedative_score > 0:
-            dual_burden_meds.append({
-                "name": med,
-                "generic_name": profile.generic_name,
-                "drug_class": profile.drug_class,
-                "anticholinergic_score": profile.anticholinergic_score,
-                "sedative_score": profile.sedative_score,
-                "combined_score": profile.anticholinergic_score + profile.sedative_score,
-                "fall_risk_score": profile.fall_risk_score,
-                "beers_criteria": profile.beers_criteria,
-                "risk_category": "VERY HIGH - Dual CNS depression mechanism",
-                "deprescribing_priority": "HIGHEST - Remove first"
-            })
-    
-    # Sort dual-mechanism drugs by combined score (highest first)
-    dual_burden_meds.sort(key=lambda x: x["combined_score"], reverse=True)
+            dual_hits.append((profile.anticholinergic_score + profile.sedative_score, med, profile))
+    
+    # Sort dual-mechanism drugs by combined score (highest first) on the
+    # small tuples, then build each entry dict once in final order
+    dual_hits.sort(key=lambda hit: hit[0], reverse=True)
+    dual_burden_meds = [
+        {
+            "name": med,
+            "generic_name": profile.generic_name,
+            "drug_class": profile.drug_class,
+            "anticholinergic_score": profile.anticholinergic_score,
+            "sedative_score": profile.sedative_score,
+            "combined_score": combined_score,
+            "fall_risk_score": profile.fall_risk_score,
+            "beers_criteria": profile.beers_criteria,
+            "risk_category": "VERY HIGH - Dual CNS depression mechanism",
+            "deprescribing_priority": "HIGHEST - Remove first"
+        }
+        for combined_score, med, profile in dual_hits
+    ]
     
     # Calculate total CNS impact (raw sum)
     total_cns_score = anticholinergic_result["total_score"] + sedative_result["total_score"]
     
     # Determine combined risk level and synergistic multiplier
-    # Multiplier represents how much worse the effects are than simple addition
-    if total_cns_score >= 8:
-        combined_risk_level = "CRITICAL - Synergistic CNS depression"
-        synergistic_multiplier = 1.5  # Effects 50% worse than additive
-        risk_interpretation = "Extreme delirium risk (>80% in hospitalized elderly). Immediate intervention required."
-    elif total_cns_score >= 5:
-        combined_risk_level = "HIGH - Multiple CNS depressant mechanisms"
-        synergistic_multiplier = 1.3  # Effects 30% worse
-        risk_interpretation = "High delirium risk (60-80% in vulnerable populations). Urgent deprescribing needed."
-    elif total_cns_score >= 3:
-        combined_risk_level = "MODERATE - Monitor cumulative CNS effects"
-        synergistic_multiplier = 1.2  # Effects 20% worse
-        risk_interpretation = "Moderate delirium risk (40-60% in hospitalized). Monitor closely, consider alternatives."
-    elif total_cns_score >= 1:
-        combined_risk_level = "LOW - Minimal combined burden"
-        synergistic_multiplier = 1.0  # Minimal synergy at low scores
-        risk_interpretation = "Low risk (<40%). Appropriate monitoring sufficient."
-    else:
-        combined_risk_level = "NONE"
-        synergistic_multiplier = 1.0
-        risk_interpretation = "No CNS burden detected. No medication-related cognitive risk."
+    for threshold, combined_risk_level, synergistic_multiplier, risk_interpretation in _CNS_LEVEL_TABLE:
+        if total_cns_score >= threshold:
+            break
     
     # Generate synergistic warnings
     synergistic_warnings = []
-    if len(dual_burden_meds) > 0:
-        synergistic_warnings.extend([
-            "⚠️ SYNERGISTIC RISK DETECTED:",
-            f"• {len(dual_burden_meds)} medication(s) affect BOTH anticholinergic AND sedative pathways",
-            "• Combined effect: Anticholinergic + Sedative effects MULTIPLY each other",
-            "• This is NOT simple addition - the interaction is exponential",
-            "",
-            "🧠 CLINICAL SIGNIFICANCE:",
-            "• Delirium risk increases EXPONENTIALLY (not linearly) with combined burden",
-            "• Hospitalized elderly with high combined burden: 80-90% delirium rate",
-            "• Functional decline accelerates: 50% lose independence within 6 months",
-            "• Mortality risk: 2-3x higher in first year",
-            "",
-            f"📊 SYNERGISTIC MULTIPLIER: {synergistic_multiplier}x",
-            f"• Effective CNS burden: {total_cns_score} × {synergistic_multiplier} = {total_cns_score * synergistic_multiplier:.1f}",
-            "• This represents the ACTUAL clinical impact (worse than raw score suggests)"
-        ])
-    
-    if total_cns_score >= 8:
-        synergistic_warnings.append("\n🚨 CRITICAL ALERT:")
-        synergistic_warnings.append("• Combined CNS burden at DANGEROUS level")
-        synergistic_warnings.append("• Immediate action required to prevent serious adverse outcomes")
-        synergistic_warnings.append("• Consider emergency department evaluation if acutely confused")
+    if detail == "full" and len(dual_burden_meds) > 0:
+        synergistic_warnings.append("⚠️ SYNERGISTIC RISK DETECTED:")
+        synergistic_warnings.append(
+            f"• {len(dual_burden_meds)} medication(s) affect BOTH anticholinergic AND sedative pathways"
+        )
+        synergistic_warnings.extend(_SYNERGY_WARN_STATIC)
+        synergistic_warnings.append(f"📊 SYNERGISTIC MULTIPLIER: {synergistic_multiplier}x")
+        synergistic_warnings.append(
+            f"• Effective CNS burden: {total_cns_score} × {synergistic_multiplier} = {total_cns_score * synergistic_multiplier:.1f}"
+        )
+        synergistic_warnings.append(_SYNERGY_WARN_FOOTER)
+    
+    if detail == "full" and total_cns_score >= 8:
+        synergistic_warnings.extend(_SYNERGY_CRITICAL_ALERT)
     
     # Generate comprehensive deprescribing recommendations
     combined_recommendations = []
-    if total_cns_score >= 5:
-        combined_recommendations.extend([
-            "🎯 DEPRESCRIBING STRATEGY - PRIORITY ORDER:",
-            "",
-            "TIER 1 (HIGHEST PRIORITY - Remove FIRST):",
-            "Dual-mechanism drugs (anticholinergic + sedative):"
-        ])
+    if detail == "full" and total_cns_score >= 5:
+        combined_recommendations.extend(_DEPRESCRIBE_TIER_HEADER)
         
         if dual_burden_meds:
-            for i, med in enumerate(dual_burden_meds, 1):
-                combined_recommendations.append(
-                    f"  {i}. {med['name']} "
-                    f"(ACB={med['anticholinergic_score']}, "
-                    f"Sedative={med['sedative_score']}, "
-                    f"Combined={med['combined_score']})"
-                )
-            combined_recommendations.append("  → These drugs cause BOTH confusion AND sedation")
-            combined_recommendations.append("  → Removing ONE dual-mechanism drug reduces BOTH burdens")
-            combined_recommendations.append("  → Maximum benefit with single deprescribing intervention")
-        
-        combined_recommendations.extend([
-            "",
-            "TIER 2 (HIGH PRIORITY):",
-            "Single-mechanism drugs with highest scores (ACB=3 or Sedative=3):"
-        ])
+            combined_recommendations.extend(
+                f"  {i}. {name} (ACB={profile.anticholinergic_score}, "
+                f"Sedative={profile.sedative_score}, Combined={combined_score})"
+                for i, (combined_score, name, profile) in enumerate(dual_hits, 1)
+            )
+            combined_recommendations.extend(_DEPRESCRIBE_TIER1_NOTES)
+        
+        combined_recommendations.extend(_DEPRESCRIBE_TIER2_HEADER)
         
         # Identify high-score single-mechanism drugs
+        dual_names = {d['name'] for d in dual_burden_meds}
         high_acb_only = [m for m in anticholinergic_result.get('contributing_medications', []) 
-                        if m['score'] == 3 and not any(d['name'] == m['name'] for d in dual_burden_meds)]
+                        if m['score'] == 3 and m['name'] not in dual_names]
         high_sed_only = [m for m in sedative_result.get('contributing_medications', []) 
-                        if m['score'] == 3 and not any(d['name'] == m['name'] for d in dual_burden_meds)]
+                        if m['score'] == 3 and m['name'] not in dual_names]
         
         if high_acb_only:
             combined_recommendations.append("  Anticholinergic-only (ACB=3):")
-            for med in high_acb_only:
-                combined_recommendations.append(f"    - {med['name']}")
+            combined_recommendations.extend(f"    - {med['name']}" for med in high_acb_only)
         
         if high_sed_only:
             combined_recommendations.append("  Sedative-only (Sedative=3):")
-            for med in high_sed_only:
-                combined_recommendations.append(f"    - {med['name']}")
-        
-        combined_recommendations.extend([
-            "",
-            "TIER 3 (MODERATE PRIORITY):",
-            "Non-essential medications (sleep aids, as-needed anxiolytics, OTC products)",
-            "  → Often these were started for convenience, not medical necessity",
-            "  → Easiest to discontinue without replacement",
-            "",
-            "TIER 4 (IF TARGET NOT REACHED):",
-            "Moderate-score drugs (ACB=2 or Sedative=2)",
-            "  → Consider alternatives or dose reduction",
-            "  → May need gradual taper",
-            "",
-            "═══════════════════════════════════════════════",
-            "🎯 TARGET GOALS FOR SAFE CNS BURDEN:",
-            "═══════════════════════════════════════════════",
-            f"Current status → Target goals:",
-            f"• Anticholinergic: {anticholinergic_result['total_score']} → <3 (ideally <2)",
-            f"• Sedative: {sedative_result['total_score']} → <3 (ideally <2)",
-            f"• Combined CNS: {total_cns_score} → <5 (ideally <3)",
-            f"• Dual-mechanism drugs: {len(dual_burden_meds)} → 0",
-            "",
-            "📅 TIMELINE:",
-            "• Tier 1 (dual-mechanism): Remove within 1 week",
-            "• Tier 2 (high-score): Remove within 2-4 weeks",
-            "• Tier 3 (non-essential): Remove within 4-8 weeks",
-            "• Tier 4 (moderate-score): Remove within 8-12 weeks",
-            "",
-            "⚠️ IMPORTANT CAVEATS:",
-            "• Benzodiazepines: MUST taper slowly (seizure risk if abrupt stop)",
-            "• Antipsychotics: Gradual taper over weeks to prevent withdrawal psychosis",
-            "• Antidepressants: Taper over 4-6 weeks to prevent discontinuation syndrome",
-            "• Always coordinate with prescribing physician before stopping medications"
-        ])
+            combined_recommendations.extend(f"    - {med['name']}" for med in high_sed_only)
+        
+        combined_recommendations.extend(_DEPRESCRIBE_TIER3_4)
+        combined_recommendations.append(
+            f"• Anticholinergic: {anticholinergic_result['total_score']} → <3 (ideally <2)"
+        )
+        combined_recommendations.append(
+            f"• Sedative: {sedative_result['total_score']} → <3 (ideally <2)"
+        )
+        combined_recommendations.append(f"• Combined CNS: {total_cns_score} → <5 (ideally <3)")
+        combined_recommendations.append(f"• Dual-mechanism drugs: {len(dual_burden_meds)} → 0")
+        combined_recommendations.extend(_DEPRESCRIBE_TIMELINE_CAVEATS)
     
     # Create comprehensive summary
     summary = {
@@ -2457,10 +3697,10 @@ def calculate_combined_cns_burden(medications: List[str]) -> dict:
             len(dual_burden_meds)  # Avoid double-counting dual-mechanism drugs
         ),
         "total_medications_assessed": len(medications),
-        "unrecognized_medications": list(set(
-            anticholinergic_result.get("unrecognized_medications", []) +
-            sedative_result.get("unrecognized_medications", [])
-        ))
+        "unrecognized_medications": list(dict.fromkeys(chain(
+            anticholinergic_result.get("unrecognized_medications", ()),
+            sedative_result.get("unrecognized_medications", ())
+        )))  # de-duplicated, first-seen order
     }
     
     return {
@@ -2515,7 +3755,29 @@ def check_interaction_legacy(drug1: str, drug2: str) -> Optional[dict]:
 # COMPREHENSIVE MEDICATION ASSESSMENT
 # ============================================================================
 
-def comprehensive_medication_assessment(medications: List[str]) -> dict:
+class RiskLevel(IntEnum):
+    """Overall risk ordering used to combine the individual assessments"""
+    NONE = 0
+    LOW = 1
+    MODERATE = 2
+    HIGH = 3
+    CRITICAL = 4
+
+
+_RISK_CODE = {level.name: level.value for level in RiskLevel}
+
+
+@lru_cache(maxsize=None)
+def _risk_code(label: str) -> int:
+    """RiskLevel value for a level label by its first word, e.g. 'HIGH - ...' -> 3; unknown -> 0"""
+    words = label.split(None, 1)
+    return _RISK_CODE.get(words[0], 0) if words else 0
+
+
+def comprehensive_medication_assessment(
+    medications: List[str],
+    detail: Literal["summary", "full"] = "full"
+) -> dict:
     """
     Perform complete medication safety assessment.
     
@@ -2524,11 +3786,15 @@ def comprehensive_medication_assessment(medications: List[str]) -> dict:
     
     Args:
         medications: List of medication names
+        detail: "full" (default), or "summary" to run the anticholinergic,
+            sedative and combined CNS assessments without their
+            recommendation and warning text
         
     Returns:
         Comprehensive dictionary containing:
         - medication_list: Validated medication list
         - interactions: All detected drug interactions
+        - total_interactions: Number of interactions across all severities
         - fall_risk: Fall risk assessment
         - anticholinergic_burden: ACB assessment
         - sedative_burden: Sedative burden assessment
@@ -2552,37 +3818,29 @@ def comprehensive_medication_assessment(medications: List[str]) -> dict:
     # Run all assessments
     interactions = check_all_interactions(valid_meds)
     fall_risk = calculate_fall_risk_score(valid_meds)
-    acb = calculate_anticholinergic_burden(valid_meds)
-    sedative = calculate_sedative_burden(valid_meds)
-    combined_cns = calculate_combined_cns_burden(valid_meds)
+    acb = calculate_anticholinergic_burden(valid_meds, detail)
+    sedative = calculate_sedative_burden(valid_meds, detail)
+    combined_cns = calculate_combined_cns_burden(
+        valid_meds, detail, anticholinergic_result=acb, sedative_result=sedative
+    )
     duplicates = detect_therapeutic_duplicates(valid_meds)
     
     # Determine overall risk level (highest of all assessments)
-    risk_levels = []
-    
-    # Map text descriptions to numeric risk
-    risk_mapping = {
-        'CRITICAL': 4,
-        'HIGH': 3,
-        'MODERATE': 2,
-        'LOW': 1,
-        'NONE': 0
-    }
-    
-    # Extract risk levels from each assessment
     if interactions['critical']:
-        risk_levels.append(4)
+        interaction_risk = RiskLevel.CRITICAL
     elif interactions['high']:
-        risk_levels.append(3)
-    
-    risk_levels.append(risk_mapping.get(fall_risk['risk_category'].split()[0], 0))
-    risk_levels.append(risk_mapping.get(acb['burden_level'].split()[0], 0))
-    risk_levels.append(risk_mapping.get(sedative['burden_level'].split()[0], 0))
-    risk_levels.append(risk_mapping.get(combined_cns['combined_risk_level'].split()[0], 0))
-    
-    max_risk_num = max(risk_levels) if risk_levels else 0
-    risk_reverse_map = {v: k for k, v in risk_mapping.items()}
-    overall_risk_level = risk_reverse_map.get(max_risk_num, 'UNKNOWN')
+        interaction_risk = RiskLevel.HIGH
+    else:
+        interaction_risk = RiskLevel.NONE
+    
+    max_risk_num = max(
+        interaction_risk,
+        _risk_code(fall_risk['risk_category']),
+        _risk_code(acb['burden_level']),
+        _risk_code(sedative['burden_level']),
+        _risk_code(combined_cns['combined_risk_level'])
+    )
+    overall_risk_level = RiskLevel(max_risk_num).name
     
     # Generate priority actions (top 5 most urgent)
     priority_actions = []
@@ -2624,8 +3882,8 @@ def comprehensive_medication_assessment(medications: List[str]) -> dict:
     
     # Priority 6: Multiple Beers Criteria violations
     beers_count = sum(
-        1 for m in valid_meds
-        if get_drug_profile(normalize_drug_name(m)) and get_drug_profile(normalize_drug_name(m)).beers_criteria
+        1 for _, profile in map(_resolve, valid_meds)
+        if profile and profile.beers_criteria
     )
     if beers_count >= 3:
         priority_actions.append(
@@ -2666,6 +3924,7 @@ def comprehensive_medication_assessment(medications: List[str]) -> dict:
             "unrecognized_medications": unrecognized_meds
         },
         "interactions": interactions,
+        "total_interactions": sum(map(len, interactions.values())),
         "fall_risk": fall_risk,
         "anticholinergic_burden": acb,
         "sedative_burden": sedative,
@@ -2673,8 +3932,8 @@ def comprehensive_medication_assessment(medications: List[str]) -> dict:
         "therapeutic_duplicates": duplicates,
         "overall_risk_level": overall_risk_level,
         "priority_actions": priority_actions,
-        "requires_immediate_action": max_risk_num >= 4,  # CRITICAL level
-        "requires_urgent_action": max_risk_num >= 3,     # HIGH level
+        "requires_immediate_action": max_risk_num >= RiskLevel.CRITICAL,
+        "requires_urgent_action": max_risk_num >= RiskLevel.HIGH,
     }
 
 
@@ -2682,6 +3941,76 @@ def comprehensive_medication_assessment(medications: List[str]) -> dict:
 # UTILITY: GENERATE PRINTABLE REPORT
 # ============================================================================
 
+# Static report sections, joined once; each is a single entry in the report lines
+_REPORT_RULE = "─" * 80
+
+_REPORT_HEADER = "\n".join((
+    "═" * 80,
+    "COMPREHENSIVE MEDICATION SAFETY ASSESSMENT",
+    "Canadian Elderly Drug Interaction Database v3.0",
+    "Assessment Date: January 06, 2026",
+    "═" * 80,
+    "",
+))
+
+_REPORT_FOOTER = "\n".join((
+    "═" * 80,
+    "END OF REPORT",
+    "═" * 80,
+    "",
+    "Note: This tool is for educational and supportive use only.",
+    "All clinical decisions must be made by a qualified healthcare professional.",
+))
+
+
+def comprehensive_assessment_batch(patients: List[List[str]]) -> List[Tuple[int, int, int, int, str]]:
+    """
+    Headline scores of comprehensive_medication_assessment for many patients at once.
+    
+    Scores come from the per-cohort batch scorers and the interaction level
+    from highest_interaction_severity, so no result dicts, warnings or
+    recommendations are built per patient; call
+    comprehensive_medication_assessment for a patient who needs the report.
+    
+    Args:
+        patients: One medication list per patient
+        
+    Returns:
+        (anticholinergic_total, sedative_total, fall_risk_total,
+        total_cns_score, overall_risk_level) per patient, in input order
+        
+    Example:
+        >>> comprehensive_assessment_batch([["Warfarin", "Bactrim", "Ambien"], ["Tylenol"]])
+        [(0, 3, 12, 3, 'CRITICAL'), (0, 0, 0, 0, 'LOW')]
+    """
+    results = []
+    for medications, (acb_total, *_), (sed_total, *_), fall_total in zip(
+        patients,
+        calculate_anticholinergic_burden_batch(patients),
+        calculate_sedative_burden_batch(patients),
+        calculate_fall_risk_scores_batch(patients)
+    ):
+        cns_total = acb_total + sed_total
+        worst = highest_interaction_severity(validate_medication_list(medications)[0])
+        if worst == 'critical':
+            interaction_risk = RiskLevel.CRITICAL
+        elif worst == 'high':
+            interaction_risk = RiskLevel.HIGH
+        else:
+            interaction_risk = RiskLevel.NONE
+        levels = [interaction_risk]
+        for score, table in ((fall_total, _FALL_CATEGORY_TABLE),
+                             (acb_total, _ACB_IMPACT_TABLE),
+                             (sed_total, _SED_IMPACT_TABLE),
+                             (cns_total, _CNS_LEVEL_TABLE)):
+            for threshold, label, *_ in table:
+                if score >= threshold:
+                    levels.append(_risk_code(label))
+                    break
+        results.append((acb_total, sed_total, fall_total, cns_total, RiskLevel(max(levels)).name))
+    return results
+
+
 def generate_assessment_report(assessment: dict, include_details: bool = True) -> str:
     """
     Generate human-readable assessment report.
@@ -2693,13 +4022,7 @@ def generate_assessment_report(assessment: dict, include_details: bool = True) -
     Returns:
         Formatted text report ready for printing or display
     """
-    lines = []
-    lines.append("═" * 80)
-    lines.append("COMPREHENSIVE MEDICATION SAFETY ASSESSMENT")
-    lines.append("Canadian Elderly Drug Interaction Database v3.0")
-    lines.append(f"Assessment Date: January 06, 2026")
-    lines.append("═" * 80)
-    lines.append("")
+    lines = [_REPORT_HEADER]
     
     # Metadata
     meta = assessment['assessment_metadata']
@@ -2710,9 +4033,9 @@ def generate_assessment_report(assessment: dict, include_details: bool = True) -
     lines.append("")
     
     # Overall risk
-    lines.append("─" * 80)
+    lines.append(_REPORT_RULE)
     lines.append(f"OVERALL RISK LEVEL: {assessment['overall_risk_level']}")
-    lines.append("─" * 80)
+    lines.append(_REPORT_RULE)
     lines.append("")
     
     # Priority actions
@@ -2723,8 +4046,11 @@ def generate_assessment_report(assessment: dict, include_details: bool = True) -
     
     # Interactions summary
     interactions = assessment['interactions']
-    total_interactions = sum(len(v) for v in interactions.values())
-    lines.append("─" * 80)
+    # Assessments built before total_interactions was added lack the key
+    total_interactions = assessment.get('total_interactions')
+    if total_interactions is None:
+        total_interactions = sum(len(v) for v in interactions.values())
+    lines.append(_REPORT_RULE)
     lines.append(f"DRUG INTERACTIONS: {total_interactions} Total")
     lines.append(f"  • Critical: {len(interactions['critical'])}")
     lines.append(f"  • High:      {len(interactions['high'])}")
@@ -2743,7 +4069,7 @@ def generate_assessment_report(assessment: dict, include_details: bool = True) -
     
     # Fall risk
     fall = assessment['fall_risk']
-    lines.append("─" * 80)
+    lines.append(_REPORT_RULE)
     lines.append(f"FALL RISK: {fall['risk_category']} (Score: {fall['total_score']})")
     lines.append(f"  High-risk medications: {fall['high_risk_count']}")
     if include_details and fall['high_risk_medications']:
@@ -2754,7 +4080,7 @@ def generate_assessment_report(assessment: dict, include_details: bool = True) -
     
     # CNS burden
     cns = assessment['combined_cns_burden']
-    lines.append("─" * 80)
+    lines.append(_REPORT_RULE)
     lines.append("CENTRAL NERVOUS SYSTEM (CNS) BURDEN:")
     lines.append(f"  Anticholinergic Burden: {cns['anticholinergic_burden']['total_score']} ({cns['anticholinergic_burden']['burden_level'].split()[0]})")
     lines.append(f"  Sedative Burden:        {cns['sedative_burden']['total_score']} ({cns['sedative_burden']['burden_level'].split()[0]})")
@@ -2766,18 +4092,13 @@ def generate_assessment_report(assessment: dict, include_details: bool = True) -
     
     # Therapeutic duplicates
     if assessment['therapeutic_duplicates']:
-        lines.append("─" * 80)
+        lines.append(_REPORT_RULE)
         lines.append("THERAPEUTIC DUPLICATIONS DETECTED:")
         for category, meds in assessment['therapeutic_duplicates'].items():
             lines.append(f"  • {category.replace('_', ' ').title()}: {', '.join(meds)}")
         lines.append("")
     
-    lines.append("═" * 80)
-    lines.append("END OF REPORT")
-    lines.append("═" * 80)
-    lines.append("")
-    lines.append("Note: This tool is for educational and supportive use only.")
-    lines.append("All clinical decisions must be made by a qualified healthcare professional.")
+    lines.append(_REPORT_FOOTER)
     
     return "\n".join(lines)
 
@@ -2799,6 +4120,14 @@ class DatabaseIntegrityError(MedicationAssessmentError):
     pass
 
 
+# (DrugProfile field, inclusive upper bound) checked by validate_database_integrity
+_SCORE_LIMITS = (
+    ("anticholinergic_score", 3),
+    ("sedative_score", 3),
+    ("fall_risk_score", 10),
+)
+
+
 def validate_database_integrity() -> Tuple[bool, List[str]]:
     """
     Validate internal database integrity.
@@ -2819,14 +4148,31 @@ def validate_database_integrity() -> Tuple[bool, List[str]]:
             if drug not in DRUG_PROFILES:
                 errors.append(f"Interaction references unknown drug '{drug}'")
     
-    # Check score ranges
+    # Check score ranges on the profile fields themselves (the score columns
+    # are derived from them); per-drug messages only for a field whose
+    # min/max is out of bounds
+    for score_field, limit in _SCORE_LIMITS:
+        values = [getattr(profile, score_field) for profile in DRUG_PROFILES.values()]
+        if values and (min(values) < 0 or max(values) > limit):
+            for drug_name, value in zip(DRUG_PROFILES, values):
+                if not (0 <= value <= limit):
+                    errors.append(f"{drug_name}: {score_field} {value} out of range (0-{limit})")
+    
     for drug_name, profile in DRUG_PROFILES.items():
-        if not (0 <= profile.anticholinergic_score <= 3):
-            errors.append(f"{drug_name}: anticholinergic_score {profile.anticholinergic_score} out of range (0-3)")
-        if not (0 <= profile.sedative_score <= 3):
-            errors.append(f"{drug_name}: sedative_score {profile.sedative_score} out of range (0-3)")
-        if not (0 <= profile.fall_risk_score <= 10):
-            errors.append(f"{drug_name}: fall_risk_score {profile.fall_risk_score} out of range (0-10)")
+        if drug_name != profile.generic_name:
+            errors.append(f"{drug_name}: keyed under a different generic_name '{profile.generic_name}'")
+        if profile.pregnancy_category not in PregnancyCategory.__members__:
+            errors.append(f"{drug_name}: unknown pregnancy_category '{profile.pregnancy_category}'")
+        if not profile.brand_names:
+            errors.append(f"{drug_name}: no brand_names listed")
+    
+    # Check brand names don't collide across profiles
+    brand_owner: Dict[str, str] = {}
+    for drug_name, profile in DRUG_PROFILES.items():
+        for brand in profile.brand_names:
+            owner = brand_owner.setdefault(brand.lower(), drug_name)
+            if owner != drug_name:
+                errors.append(f"Brand name '{brand}' listed for both '{owner}' and '{drug_name}'")
     
     return (len(errors) == 0, errors)
 
@@ -2835,7 +4181,10 @@ def validate_database_integrity() -> Tuple[bool, List[str]]:
 # MODULE INITIALIZATION CHECK
 # ============================================================================
 
-_INTEGRITY_CHECK_ENABLED = True
+# The tables are static, so the full check is a release-time step
+# (`python interaction_database.py`) rather than a cost paid by every import.
+# Set MEDDB_INTEGRITY_CHECK=1 to also run it on import.
+_INTEGRITY_CHECK_ENABLED = os.environ.get("MEDDB_INTEGRITY_CHECK") == "1"
 
 if _INTEGRITY_CHECK_ENABLED:
     is_valid, errors = validate_database_integrity()
@@ -2927,6 +4276,11 @@ def debug_interaction_lookup(drug1: str, drug2: str) -> None:
 # ============================================================================
 
 if __name__ == "__main__":
+    is_valid, errors = validate_database_integrity()
+    print(f"Database integrity: {'OK' if is_valid else f'{len(errors)} issue(s)'}")
+    for error in errors:
+        print(f"   {error}")
+    
     # Test the problematic case
     print("Testing Warfarin + Bactrim interaction...")
     
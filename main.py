@@ -3,7 +3,6 @@
 
 from core.cognitive_load import calculate_mcls
 from core.interaction_score import calculate_dir_score_from_list
-from interaction_database import check_interaction, normalize_drug_name
 from elderly_med_burden import (
     assess_beers_criteria,
     calculate_fall_risk,
@@ -17,11 +16,16 @@ from elderly_med_burden import (
 import os
 import csv
 from datetime import datetime
+from functools import lru_cache
+from itertools import combinations
+from operator import itemgetter
 
-# Create reports directory if it doesn't exist
+# interaction_database builds its lookup tables on import (most of this
+# script's start-up time); it is imported inside the functions that use it so
+# the disclaimer and prompts come up before it loads.
+
+# Reports directory, created on first export rather than at import
 REPORTS_DIR = "reports"
-if not os.path.exists(REPORTS_DIR):
-    os.makedirs(REPORTS_DIR)
 
 DISCLAIMER = """
 ================================================================================
@@ -76,52 +80,74 @@ def get_patient_info():
         "caregiver_present": caregiver_present
     }
 
-def filter_interactions(meds):
-    """Check interactions using local database"""
-    interactions = []
+def filter_interactions(meds, verbose=False):
+    """Check interactions using local database
+    
+    Only drugs that appear in some interaction are paired up (see
+    iter_interactions); pass verbose=True to also list every pair that has
+    no known interaction.
+    """
+    from interaction_database import iter_interactions
+    
+    names = [med["name"] for med in meds]
     
     print("\n" + "="*80)
     print("CHECKING DRUG INTERACTIONS")
     print("="*80)
     
-    checked_pairs = 0
-    for i, med1 in enumerate(meds):
-        for med2 in meds[i+1:]:
-            checked_pairs += 1
-            interaction = check_interaction(med1["name"], med2["name"])
-            if interaction:
-                print(f"⚠️  INTERACTION: {med1['name']} + {med2['name']}")
-                interactions.append((
-                    med1["name"],
-                    med2["name"],
-                    interaction["severity"]
-                ))
-            else:
-                print(f"   ✓ No known interaction: {med1['name']} + {med2['name']}")
+    interactions = [
+        (interaction["drugs"][0], interaction["drugs"][1], interaction["severity"])
+        for interaction in iter_interactions(names)
+        if len(interaction["drugs"]) == 2
+    ]
+    
+    # One write for the whole pair listing instead of a print() per pair
+    if verbose:
+        found = {(med1, med2) for med1, med2, _ in interactions}
+        lines = [
+            f"⚠️  INTERACTION: {med1} + {med2}" if (med1, med2) in found
+            else f"   ✓ No known interaction: {med1} + {med2}"
+            for med1, med2 in combinations(names, 2)
+        ]
+    else:
+        lines = [f"⚠️  INTERACTION: {med1} + {med2}" for med1, med2, _ in interactions]
+    if lines:
+        print("\n".join(lines))
     
+    checked_pairs = len(names) * (len(names) - 1) // 2
     print(f"\n📊 Checked {checked_pairs} drug pair(s), found {len(interactions)} interaction(s)")
     
     return interactions
 
+@lru_cache(maxsize=1024)
+def interaction_description(drug1, drug2):
+    """Description of the drug1 + drug2 interaction, or None if there is none
+    
+    Cached so the console report and the CSV export share one lookup per
+    triggered pair; only the (immutable) description string is kept.
+    """
+    from interaction_database import check_interaction
+    
+    interaction = check_interaction(drug1, drug2)
+    return interaction["description"] if interaction else None
+
 def print_daily_schedule(schedule):
     """Print visual daily medication schedule"""
-    print("\n" + "="*80)
-    print("📅 DAILY MEDICATION SCHEDULE")
-    print("="*80)
+    lines = ["\n" + "="*80, "📅 DAILY MEDICATION SCHEDULE", "="*80]
     
     for time_slot, medications in schedule.items():
+        lines.append(f"\n{time_slot}")
+        lines.append("-" * 40)
         if medications:
-            print(f"\n{time_slot}")
-            print("-" * 40)
-            for med in medications:
-                print(f"  💊 {med}")
+            lines.extend(f"  💊 {med}" for med in medications)
         else:
-            print(f"\n{time_slot}")
-            print("-" * 40)
-            print("  (none)")
+            lines.append("  (none)")
+    
+    lines.append("\n💡 TIP: Use a pill organizer to prepare medications weekly")
+    lines.append("💡 TIP: Set phone alarms for each medication time")
     
-    print("\n💡 TIP: Use a pill organizer to prepare medications weekly")
-    print("💡 TIP: Set phone alarms for each medication time")
+    # One write for the whole block instead of a print() per line
+    print("\n".join(lines))
 
 def generate_comprehensive_report(patient_info, meds, dir_triggers, mcls_score, mcls_burden, mcls_explanation):
     """Generate comprehensive elderly medication burden report"""
@@ -241,11 +267,11 @@ def generate_comprehensive_report(patient_info, meds, dir_triggers, mcls_score,
     if dir_triggers:
         print(f"\n⚠️  {len(dir_triggers)} INTERACTION(S) DETECTED:")
         for idx, (a, b, severity) in enumerate(dir_triggers, 1):
-            interaction_detail = check_interaction(a, b)
+            description = interaction_description(a, b)
             print(f"\n{idx}. {a.upper()} + {b.upper()}")
             print(f"   Severity: {severity.upper()}")
-            if interaction_detail:
-                print(f"   Details: {interaction_detail['description']}")
+            if description is not None:
+                print(f"   Details: {description}")
     else:
         print("✓ No interactions detected in database")
     
@@ -316,18 +342,28 @@ def generate_comprehensive_report(patient_info, meds, dir_triggers, mcls_score,
         "risk_factors": risk_factors
     }
 
-def export_detailed_report(report_data, meds, dir_triggers):
-    """Export comprehensive CSV report"""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+# Category, Risk Level, Rationale, Recommendation cells of a Beers violation row
+BEERS_DETAIL_COLUMNS = itemgetter("category", "risk", "rationale", "recommendation")
+
+def export_detailed_report(report_data, meds, dir_triggers, run_time=None):
+    """Export comprehensive CSV report
+    
+    run_time (default: now) sets both the file name timestamp and the
+    "Generated:" row, so one run's files can share a timestamp.
+    """
+    if run_time is None:
+        run_time = datetime.now()
+    timestamp = run_time.strftime("%Y%m%d_%H%M%S")
     report_filename = f"elderly_med_report_{timestamp}.csv"
     report_path = os.path.join(REPORTS_DIR, report_filename)  # Changed this line
+    os.makedirs(REPORTS_DIR, exist_ok=True)
     
     with open(report_path, mode="w", newline="", encoding="utf-8") as f:  # Changed this line
         writer = csv.writer(f)
         
         # Header
         writer.writerow(["ELDER MED MANAGER - COMPREHENSIVE REPORT"])
-        writer.writerow(["Generated:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
+        writer.writerow(["Generated:", run_time.strftime("%Y-%m-%d %H:%M:%S")])
         writer.writerow([])
         
         # Patient Info
@@ -340,8 +376,7 @@ def export_detailed_report(report_data, meds, dir_triggers):
         # Medications
         writer.writerow(["CURRENT MEDICATIONS"])
         writer.writerow(["Medication", "Doses Per Day"])
-        for med in meds:
-            writer.writerow([med["name"], med["doses_per_day"]])
+        writer.writerows([med["name"], med["doses_per_day"]] for med in meds)
         writer.writerow([])
         
         # Summary Metrics
@@ -360,14 +395,10 @@ def export_detailed_report(report_data, meds, dir_triggers):
         writer.writerow(["BEERS CRITERIA VIOLATIONS"])
         if report_data["beers_violations"]:
             writer.writerow(["Medication", "Category", "Risk Level", "Rationale", "Recommendation"])
-            for violation in report_data["beers_violations"]:
-                writer.writerow([
-                    violation["drug"],
-                    violation["details"]["category"],
-                    violation["details"]["risk"],
-                    violation["details"]["rationale"],
-                    violation["details"]["recommendation"]
-                ])
+            writer.writerows(
+                [violation["drug"], *BEERS_DETAIL_COLUMNS(violation["details"])]
+                for violation in report_data["beers_violations"]
+            )
         else:
             writer.writerow(["No Beers Criteria violations detected"])
         writer.writerow([])
@@ -375,33 +406,32 @@ def export_detailed_report(report_data, meds, dir_triggers):
         # Daily Schedule
         writer.writerow(["DAILY MEDICATION SCHEDULE"])
         writer.writerow(["Time", "Medications"])
-        for time_slot, medications in report_data["schedule"].items():
-            med_list = ", ".join(medications) if medications else "(none)"
-            writer.writerow([time_slot, med_list])
+        writer.writerows(
+            [time_slot, ", ".join(medications) if medications else "(none)"]
+            for time_slot, medications in report_data["schedule"].items()
+        )
         writer.writerow([])
         
         # Interactions
         writer.writerow(["DRUG INTERACTIONS"])
         if dir_triggers:
             writer.writerow(["Drug 1", "Drug 2", "Severity", "Description"])
-            for a, b, severity in dir_triggers:
-                interaction_detail = check_interaction(a, b)
-                desc = interaction_detail['description'] if interaction_detail else "N/A"
-                writer.writerow([a, b, severity, desc])
+            writer.writerows(
+                [a, b, severity, interaction_description(a, b) or "N/A"]
+                for a, b, severity in dir_triggers
+            )
         else:
             writer.writerow(["No interactions detected in database"])
         writer.writerow([])
         
         # Recommendations
         writer.writerow(["SIMPLIFICATION RECOMMENDATIONS"])
-        for rec in report_data["simplification_recs"]:
-            writer.writerow([rec])
+        writer.writerows([rec] for rec in report_data["simplification_recs"])
         writer.writerow([])
         
         # Risk Summary
         writer.writerow(["KEY RISK FACTORS"])
-        for factor in report_data["risk_factors"]:
-            writer.writerow([factor])
+        writer.writerows([factor] for factor in report_data["risk_factors"])
         writer.writerow([])
         
         # Disclaimer
@@ -410,20 +440,32 @@ def export_detailed_report(report_data, meds, dir_triggers):
     
     return report_path
 
-def save_console_output_to_file(output_text):
-    """Save console output to a text file in the reports folder"""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+def console_output_path(run_time=None):
+    """Path for a new console output text file in the reports folder (created if needed)"""
+    if run_time is None:
+        run_time = datetime.now()
+    timestamp = run_time.strftime("%Y%m%d_%H%M%S")
     output_filename = f"console_output_{timestamp}.txt"
-    output_path = os.path.join(REPORTS_DIR, output_filename)
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    return os.path.join(REPORTS_DIR, output_filename)
+
+class TeeWriter:
+    """Minimal text stream that writes everything to several streams at once"""
+    
+    def __init__(self, *streams):
+        self.streams = streams
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(output_text)
+    def write(self, text):
+        for stream in self.streams:
+            stream.write(text)
+        return len(text)
     
-    return output_path
+    def flush(self):
+        for stream in self.streams:
+            stream.flush()
 
 def main():
     import sys
-    from io import StringIO
     
     print(DISCLAIMER)
     
@@ -481,56 +523,50 @@ def main():
             "rxcui": None
         })
     
-    # Create a string buffer to capture all output AFTER user input
-    output_buffer = StringIO()
-    
-    # Redirect stdout to buffer (AFTER getting all user input)
-    original_stdout = sys.stdout
-    sys.stdout = output_buffer
+    # Tee all output AFTER user input to the console and the output file as
+    # it is printed
+    # One timestamp for both of this run's files
+    run_time = datetime.now()
+    console_file = console_output_path(run_time)
     
-    try:
-        # Check interactions
-        dir_triggers = filter_interactions(meds)
+    with open(console_file, "w", encoding="utf-8") as output_file:
+        original_stdout = sys.stdout
+        sys.stdout = TeeWriter(original_stdout, output_file)
         
-        # Calculate MCLS
-        mcls_score, mcls_burden, mcls_explanation = calculate_mcls(meds)
-        
-        # Generate comprehensive report
-        report_data = generate_comprehensive_report(
-            patient_info, meds, dir_triggers, 
-            mcls_score, mcls_burden, mcls_explanation
-        )
-        
-        # Export to CSV
-        report_file = export_detailed_report(report_data, meds, dir_triggers)
-        
-        print(f"\n{'='*80}")
-        print(f"📄 Detailed report exported to: {report_file}")
-        print("="*80)
-        
-        print("\n" + "="*80)
-        print("⚠️  IMPORTANT REMINDERS")
-        print("="*80)
-        print("• Share this report with patient's healthcare team")
-        print("• Do NOT make medication changes without professional consultation")
-        print("• This tool is for educational and assessment purposes only")
-        print("• Regular medication reviews are essential for elderly patients")
-        print("="*80)
-        
-    finally:
-        # Restore original stdout
-        sys.stdout = original_stdout
-        
-        # Get the captured output
-        console_output = output_buffer.getvalue()
-        
-        # Print it to console
-        print(console_output)
-        
-        # Save it to file
-        console_file = save_console_output_to_file(console_output)
-        print(f"\n📄 Console output saved to: {console_file}")
-
+        try:
+            # Check interactions
+            dir_triggers = filter_interactions(meds)
+            
+            # Calculate MCLS
+            mcls_score, mcls_burden, mcls_explanation = calculate_mcls(meds)
+            
+            # Generate comprehensive report
+            report_data = generate_comprehensive_report(
+                patient_info, meds, dir_triggers, 
+                mcls_score, mcls_burden, mcls_explanation
+            )
+            
+            # Export to CSV
+            report_file = export_detailed_report(report_data, meds, dir_triggers, run_time)
+            
+            print(f"\n{'='*80}")
+            print(f"📄 Detailed report exported to: {report_file}")
+            print("="*80)
+            
+            print("\n" + "="*80)
+            print("⚠️  IMPORTANT REMINDERS")
+            print("="*80)
+            print("• Share this report with patient's healthcare team")
+            print("• Do NOT make medication changes without professional consultation")
+            print("• This tool is for educational and assessment purposes only")
+            print("• Regular medication reviews are essential for elderly patients")
+            print("="*80)
+            
+        finally:
+            # Restore original stdout; the file holds whatever was printed,
+            # so point to it even if the report failed part-way
+            sys.stdout = original_stdout
+            print(f"\n📄 Console output saved to: {console_file}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file